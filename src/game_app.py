@@ -6,7 +6,12 @@ from src.poker.table import PokerTable
 
 class GameApp:
     def __init__(self) -> None:
-        pygame.init()
+        # Init only the subsystems we actually use. pygame.init() would also
+        # start pygame.mixer, whose audio-polling thread burns CPU even while
+        # the game is silent; if sound is ever added, call pygame.mixer.init()
+        # on demand at that point.
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption(CONFIG.title)
 
         self.screen = pygame.display.set_mode((CONFIG.width, CONFIG.height), pygame.RESIZABLE)
@@ -27,13 +32,25 @@ class GameApp:
         while self.running:
             dt = self.clock.tick(CONFIG.fps) / 1000.0
             
-            for event in pygame.event.get():
+            if self.active_screen.is_animating:
+                events = pygame.event.get()
+            else:
+                # Nothing is animating: sleep in the kernel until input
+                # arrives (or one frame interval passes) instead of spinning.
+                first = pygame.event.wait(int(1000 / CONFIG.fps))
+                events = pygame.event.get()
+                if first.type != pygame.NOEVENT:
+                    events.insert(0, first)
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.quit()
                 elif event.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                    self.active_screen.needs_redraw = True
                 else:
                     self.active_screen.handle_event(event)
+                    self.active_screen.needs_redraw = True
 
             self.active_screen.update(dt)
             next_screen = self.active_screen.pop_requested_screen()
@@ -41,8 +58,19 @@ class GameApp:
                 setattr(next_screen, "table", self.table)
                 self.active_screen = next_screen
 
-            self.screen.fill(CONFIG.bg_color)
-            self.active_screen.draw(self.screen)
-            pygame.display.flip()
+            # Only repaint when something actually changed (events, animation,
+            # table state); otherwise the previous frame is still valid.
+            if self.active_screen.needs_redraw:
+                self.screen.fill(CONFIG.bg_color)
+                self.active_screen.draw(self.screen)
+                # The back buffer always holds the full frame; dirty rects
+                # only limit how much of it is pushed to the display.
+                dirty = self.active_screen.dirty_rects
+                if dirty:
+                    pygame.display.update(dirty)
+                    dirty.clear()
+                else:
+                    pygame.display.flip()
+                self.active_screen.needs_redraw = False
 
         pygame.quit()
\ No newline at end of file
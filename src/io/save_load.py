@@ -1,17 +1,69 @@
 from __future__ import annotations
 import json
+import os
+import queue
+import threading
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SAVE_DIR = Path("saves")
 SAVE_DIR.mkdir(exist_ok=True)
 
+# Saves are serialised on the caller's thread (so later mutation of `data` is
+# safe) and written by a single background thread, keeping slow disks from
+# stalling the render loop. The bounded queue applies back-pressure if writes
+# somehow pile up.
+_save_queue: queue.Queue[tuple[Path, bytes]] = queue.Queue(maxsize=32)
+
+
+def _serialize(data: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; skip the str round-trip.
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _drain() -> None:
+    while True:
+        path, payload = _save_queue.get()
+        try:
+            # Write-then-rename so a crash mid-write never corrupts the save.
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            # A failed write (disk full, permissions, ...) must not kill the
+            # writer thread: the bounded queue would fill and save_json /
+            # flush_saves would block forever. Losing one save is the lesser
+            # evil.
+            print(f"[IO] Could not write {path}: {e}")
+        finally:
+            _save_queue.task_done()
+
+
+_writer = threading.Thread(target=_drain, name="save-writer", daemon=True)
+_writer.start()
+
+
 def save_json(filename: str, data: dict[str, Any]) -> None:
-    path = SAVE_DIR / filename
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    _save_queue.put((SAVE_DIR / filename, _serialize(data)))
+
+
+def flush_saves() -> None:
+    """Block until every queued save has hit disk (call before shutdown)."""
+    _save_queue.join()
+
 
 def load_json(filename: str) -> dict[str, Any] | None:
+    flush_saves()  # read-your-writes: don't race a save still in the queue
     path = SAVE_DIR / filename
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
\ No newline at end of file
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
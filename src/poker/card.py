@@ -4,8 +4,56 @@ from dataclasses import dataclass
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 SUITS = ["C", "D", "H", "S"]  # Clubs, Diamonds, Hearts, Spades
 
-@dataclass(frozen=True)
+# One prime per rank (2..A); the product of five primes uniquely identifies a
+# 5-card rank multiset (Cactus-Kev prime hash).
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+RANK_INDEX = {r: i for i, r in enumerate(RANKS)}
+SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
+
+
+def encode_card(rank_idx: int, suit_idx: int) -> int:
+    """
+    Pack a card into a single int (Cactus-Kev layout):
+
+        bits 16-28: rank one-hot (bit 16 = deuce ... bit 28 = ace)
+        bits 12-15: suit one-hot (bit 12 = C, 13 = D, 14 = H, 15 = S)
+        bits  8-11: rank index (0..12)
+        bits  0- 5: rank prime (2..41)
+
+    Flush detection over five cards is then a single AND against 0xF000,
+    the rank OR-mask is `code >> 16`, and the prime hash is a product of
+    `code & 0x3F` values.
+    """
+    return (1 << (16 + rank_idx)) | (1 << (12 + suit_idx)) | (rank_idx << 8) | PRIMES[rank_idx]
+
+
+# All 52 packed cards, grouped by suit (same order the Deck uses).
+CARD_CODES: list[int] = [encode_card(ri, si) for si in range(len(SUITS)) for ri in range(len(RANKS))]
+
+_CODE_BY_PAIR: dict[tuple[str, str], int] = {
+    (r, s): encode_card(RANK_INDEX[r], SUIT_INDEX[s]) for s in SUITS for r in RANKS
+}
+
+
+def code_rank(code: int) -> str:
+    return RANKS[(code >> 8) & 0xF]
+
+
+def code_suit(code: int) -> str:
+    return SUITS[((code >> 12) & 0xF).bit_length() - 1]
+
+
+def code_short_name(code: int) -> str:
+    return f"{code_rank(code)}{code_suit(code)}"
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
+    """
+    Thin string-based facade kept for the UI/IO layer; the evaluator works on
+    packed ints (see `encode_card`).
+    """
     rank: str
     suit: str
 
@@ -15,8 +63,19 @@ class Card:
         if self.suit not in SUITS:
             raise ValueError(f"Invalid suit: {self.suit}")
 
+    @property
+    def code(self) -> int:
+        return _CODE_BY_PAIR[(self.rank, self.suit)]
+
     def short_name(self) -> str:
         return f"{self.rank}{self.suit}"
 
     def __str__(self) -> str:
-        return self.short_name()
\ No newline at end of file
+        return self.short_name()
+
+
+# Every Card facade, built (and validated) once at import in the same
+# suit-major order as CARD_CODES. Game state holds packed ints; index into
+# this pool when a facade is needed, and keep the validating constructor
+# for IO/UI boundaries where strings come from outside.
+ALL_CARDS: tuple[Card, ...] = tuple(Card(r, s) for s in SUITS for r in RANKS)
@@ -1,11 +1,98 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
-import random
+from functools import lru_cache
+
+import numpy as np
+
 from src.poker.player import Player
-from src.poker.rules import Action
-from src.poker.card import Card, RANKS, SUITS
-from src.poker.hand_evaluator import best_of_7
+from src.poker.rules import Action, HandRank
+from src.poker.card import CARD_CODES
+from src.poker.hand_evaluator import (
+    JIT_AVAILABLE,
+    best_class,
+    best_class_with_board,
+    board_eval_cache,
+    class_rank_info,
+    jit_equity_wins,
+)
+
+
+# Heads-up equity (win or tie) vs one random hand, precomputed with this
+# evaluator at 100k Monte-Carlo boards per class. Indices are rank indices
+# (0 = deuce .. 12 = ace): [hi][lo] is suited, [lo][hi] is offsuit, and the
+# diagonal holds pocket pairs.
+_PREFLOP_EQUITY: tuple[tuple[float, ...], ...] = (
+    (0.513, 0.354, 0.367, 0.374, 0.374, 0.374, 0.396, 0.417, 0.443, 0.467, 0.497, 0.525, 0.569),
+    (0.387, 0.545, 0.381, 0.391, 0.392, 0.395, 0.402, 0.426, 0.451, 0.476, 0.505, 0.537, 0.579),
+    (0.398, 0.416, 0.580, 0.411, 0.410, 0.415, 0.417, 0.432, 0.461, 0.484, 0.513, 0.542, 0.587),
+    (0.408, 0.423, 0.445, 0.609, 0.427, 0.434, 0.439, 0.450, 0.465, 0.497, 0.523, 0.557, 0.599),
+    (0.406, 0.423, 0.443, 0.461, 0.641, 0.451, 0.460, 0.468, 0.482, 0.502, 0.532, 0.565, 0.596),
+    (0.409, 0.430, 0.444, 0.463, 0.480, 0.668, 0.472, 0.484, 0.501, 0.517, 0.537, 0.571, 0.604),
+    (0.428, 0.432, 0.453, 0.470, 0.490, 0.500, 0.694, 0.500, 0.518, 0.531, 0.554, 0.576, 0.612),
+    (0.447, 0.458, 0.463, 0.482, 0.500, 0.511, 0.526, 0.727, 0.534, 0.551, 0.568, 0.594, 0.621),
+    (0.470, 0.478, 0.488, 0.493, 0.512, 0.528, 0.542, 0.559, 0.754, 0.565, 0.585, 0.610, 0.636),
+    (0.495, 0.506, 0.510, 0.524, 0.527, 0.539, 0.557, 0.573, 0.589, 0.781, 0.593, 0.618, 0.648),
+    (0.523, 0.531, 0.539, 0.546, 0.554, 0.561, 0.575, 0.594, 0.606, 0.614, 0.801, 0.626, 0.655),
+    (0.553, 0.560, 0.571, 0.579, 0.586, 0.593, 0.597, 0.610, 0.632, 0.638, 0.641, 0.826, 0.661),
+    (0.594, 0.601, 0.612, 0.618, 0.618, 0.625, 0.633, 0.641, 0.657, 0.662, 0.668, 0.678, 0.853),
+)
+
+
+def _sample_rows(rng: np.random.Generator, n_remaining: int, iters: int, k: int) -> np.ndarray:
+    """
+    (iters, k) matrix of indices into the remaining deck, drawn in one
+    batched call; rows containing a duplicate are resampled until clean.
+    """
+    idx = rng.integers(0, n_remaining, size=(iters, k))
+    bad = (np.diff(np.sort(idx, axis=1), axis=1) == 0).any(axis=1)
+    while bad.any():
+        idx[bad] = rng.integers(0, n_remaining, size=(int(bad.sum()), k))
+        bad = (np.diff(np.sort(idx, axis=1), axis=1) == 0).any(axis=1)
+    return idx
+
+
+@lru_cache(maxsize=4096)
+def _equity_cached(hole_key: tuple[int, int], board_key: tuple[int, ...], iters: int) -> float:
+    """
+    Monte-Carlo equity vs one random opponent, memoised per (hole, board)
+    composition so every seat facing the same spot this street -- and every
+    re-poll of the same seat -- reuses the first simulation. Seeding from the
+    key keeps repeat lookups for one spot consistent with each other.
+    """
+    known = set(hole_key) | set(board_key)
+    remaining = np.array([c for c in CARD_CODES if c not in known], dtype=np.int64)
+
+    rng = np.random.default_rng(abs(hash((hole_key, board_key))))
+    need = 5 - len(board_key)
+    idx = _sample_rows(rng, len(remaining), iters, 2 + need)
+
+    comm_codes = list(board_key)
+    h1, h2 = hole_key
+
+    if JIT_AVAILABLE:
+        # The whole win-count loop runs compiled: one call per decision.
+        return jit_equity_wins(h1, h2, comm_codes, remaining[idx]) / iters
+
+    rows = remaining[idx].tolist()
+    wins = 0
+
+    if need == 0:
+        # Full board: hero's class is constant, and both players share the
+        # same board partials.
+        cache = board_eval_cache(comm_codes)
+        hero = best_class_with_board(cache, h1, h2)
+        for row in rows:
+            wins += 1 if hero >= best_class_with_board(cache, row[0], row[1]) else 0
+        return wins / iters
+
+    for row in rows:
+        cache = board_eval_cache(comm_codes + row[2:])
+        hero = best_class_with_board(cache, h1, h2)
+        villain = best_class_with_board(cache, row[0], row[1])
+        wins += 1 if hero >= villain else 0
+
+    return wins / iters
 
 
 class CPUPersonality(Enum):
@@ -14,7 +101,7 @@ class CPUPersonality(Enum):
     DEFENSIVE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class CPUPlayer(Player):
     personality: CPUPersonality = CPUPersonality.NEUTRAL
 
@@ -22,50 +109,46 @@ class CPUPlayer(Player):
     think_min: float = 0.8
     think_max: float = 1.8
 
-    _rng: random.Random = field(default_factory=random.Random, repr=False)
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, repr=False)
 
     def sample_think_time(self) -> float:
         return self._rng.uniform(self.think_min, self.think_max)
-    
-    def _estimate_strength(self, hole: list[Card], community: list[Card], iters: int = 80) -> float:
+
+    def _estimate_strength(self, hole: list[int], community: list[int], iters: int = 80) -> float:
         """
         Very simple Monte Carlo strength estimate:
         - uses only hole + currently revealed community
         - randomly completes the board and compares vs 1 random opponent
         Not omniscient; no peeking at deck.
         """
-        known = hole + community
         if len(hole) != 2:
             return 0.0
 
-        # Build remaining deck excluding known
-        known_set = {(c.rank, c.suit) for c in known}
-        remaining = [Card(r, s) for s in SUITS for r in RANKS if (r, s) not in known_set]
-
-        need = max(0, 5 - len(community))
-        if need == 0 and len(community) == 5:
-            # Full information: just compare vs random opponent on full board
-            wins = 0
-            for _ in range(iters):
-                opp = self._rng.sample(remaining, 2)
-                hr1, tb1, _ = best_of_7(hole + community)
-                hr2, tb2, _ = best_of_7(opp + community)
-                wins += 1 if (hr1, tb1) >= (hr2, tb2) else 0
-            return wins / iters
-
-        wins = 0
-        for _ in range(iters):
-            sample = self._rng.sample(remaining, 2 + need)
-            opp = sample[:2]
-            board_add = sample[2:]
-            board = community + board_add
-
-            hr1, tb1, _ = best_of_7(hole + board)
-            hr2, tb2, _ = best_of_7(opp + board)
-
-            wins += 1 if (hr1, tb1) >= (hr2, tb2) else 0
-
-        return wins / iters
+        hole_codes = sorted(hole)  # rank one-hot dominates, so code order == rank order
+
+        # Pre-flop there are only 169 distinct spots; use the precomputed table.
+        if not community:
+            lo = (hole_codes[0] >> 8) & 0xF
+            hi = (hole_codes[1] >> 8) & 0xF
+            suited = (hole_codes[0] & hole_codes[1] & 0xF000) != 0
+            if hi == lo or suited:
+                return _PREFLOP_EQUITY[hi][lo]
+            return _PREFLOP_EQUITY[lo][hi]
+
+        board_key = tuple(sorted(community))
+
+        # Trivially dominant/dominated spots don't need a simulation: a made
+        # flush or better is near-certain to hold up, and on the river (no
+        # draws left) high card / bottom pair is near-certain not to.
+        hr, tb = class_rank_info(best_class(hole_codes + list(board_key)))
+        if hr >= HandRank.FLUSH:
+            return 0.95
+        if len(board_key) == 5 and (
+            hr == HandRank.HIGH_CARD or (hr == HandRank.ONE_PAIR and tb[0] == 2)
+        ):
+            return 0.08
+
+        return _equity_cached((hole_codes[0], hole_codes[1]), board_key, iters)
 
     def choose_action(
         self,
@@ -1,26 +1,45 @@
 from __future__ import annotations
-import random
 from typing import List
 
-from src.poker.card import Card, RANKS, SUITS
+import numpy as np
+
+from src.poker.card import CARD_CODES
+
+# The deck is an index array over the shared CARD_CODES pool. reset() only
+# re-copies the identity ordering and reshuffles; cards are dealt as packed
+# ints straight out of the pool.
+_DECK_INDICES = np.arange(len(CARD_CODES), dtype=np.int8)
 
 class Deck:
     def __init__(self, seed: int | None = None) -> None:
-        self._rng = random.Random(seed)
-        self._cards: List[Card] = []
+        self._rng = np.random.default_rng(seed)
+        self._order = _DECK_INDICES.copy()
+        self._next = 0
         self.reset()
 
     def reset(self) -> None:
-        self._cards = [Card(r, s) for s in SUITS for r in RANKS]
+        np.copyto(self._order, _DECK_INDICES)
+        self._next = 0
         self.shuffle()
 
     def shuffle(self) -> None:
-        self._rng.shuffle(self._cards)
+        # Only the undrawn portion, same as shuffling the old pop-from list.
+        self._rng.shuffle(self._order[self._next :])
+
+    def draw(self) -> int:
+        if self._next >= len(self._order):
+            raise RuntimeError("Deck is empty")
+        card = CARD_CODES[self._order[self._next]]
+        self._next += 1
+        return card
 
-    def draw(self) -> Card:
-        if not self._cards:
+    def draw_many(self, n: int) -> List[int]:
+        """Draw n cards with one slice instead of n draw() calls."""
+        if self._next + n > len(self._order):
             raise RuntimeError("Deck is empty")
-        return self._cards.pop()
+        cards = [CARD_CODES[i] for i in self._order[self._next : self._next + n]]
+        self._next += n
+        return cards
 
     def remaining(self) -> int:
-        return len(self._cards)
\ No newline at end of file
+        return len(self._order) - self._next
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from itertools import combinations
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
 from typing import Iterable
 
-from src.poker.card import Card, RANKS
+from src.poker.card import CARD_CODES, Card, PRIMES, RANKS
 from src.poker.rules import HandRank, HAND_RANK_NAME
 
 _RANK_TO_VAL = {r: i + 2 for i, r in enumerate(RANKS)}  # 2..14
@@ -13,36 +13,40 @@ def _r(v: int) -> str:
     return _VAL_TO_RANK.get(v, str(v))
 
 
-def _is_straight(vals_desc: list[int]) -> tuple[bool, int]:
-    """
-    vals_desc: unique ranks sorted high->low
-    Returns (is_straight, high_card_of_straight)
-    Handles wheel A-2-3-4-5 (high=5).
-    """
-    if len(vals_desc) < 5:
-        return (False, 0)
+def _to_codes(cards: Iterable[Card | int]) -> list[int]:
+    """Accept either packed ints or Card facades (UI/IO callers)."""
+    return [c if isinstance(c, int) else c.code for c in cards]
 
-    # normal
-    for i in range(len(vals_desc) - 4):
-        window = vals_desc[i : i + 5]
-        if window[0] - window[4] == 4 and len(set(window)) == 5:
-            return (True, window[0])
 
-    # wheel: A,5,4,3,2
-    wheel = {14, 5, 4, 3, 2}
-    if wheel.issubset(set(vals_desc)):
-        return (True, 5)
+# (mask, straight high card) checked high->low against the 13-bit rank
+# OR-mask (bit 0 = deuce .. bit 12 = ace); the last entry is the wheel.
+_STRAIGHT_MASKS: tuple[tuple[int, int], ...] = tuple(
+    (0b11111 << i, i + 6) for i in range(8, -1, -1)
+) + ((0b1000000001111, 5),)
 
-    return (False, 0)
 
+def _is_straight(rank_bits: int) -> tuple[bool, int]:
+    """
+    rank_bits: OR of 1 << rank_idx over the hand's (unique) ranks.
+    Returns (is_straight, high_card_of_straight); the wheel A-2-3-4-5
+    reports high=5. Hands with a repeated rank can never match a mask.
+    """
+    for mask, high in _STRAIGHT_MASKS:
+        if rank_bits & mask == mask:
+            return (True, high)
+    return (False, 0)
 
-def _score_5(cards: list[Card]) -> tuple[HandRank, tuple[int, ...], str]:
-    vals = sorted((_RANK_TO_VAL[c.rank] for c in cards), reverse=True)
-    suits = [c.suit for c in cards]
-    is_flush = len(set(suits)) == 1
 
-    uniq_vals = sorted(set(vals), reverse=True)
-    is_straight, straight_high = _is_straight(uniq_vals)
+def _score_ranks(vals: list[int], is_flush: bool) -> tuple[HandRank, tuple[int, ...]]:
+    """
+    Classify five rank values (sorted high->low, suits abstracted away to a
+    flush flag). Only used once per equivalence class while building the
+    lookup tables below; the hot path never runs this cascade.
+    """
+    rank_bits = 0
+    for v in vals:
+        rank_bits |= 1 << (v - 2)
+    is_straight, straight_high = _is_straight(rank_bits)
 
     # counts: (count, value) sorted by count desc then value desc
     counts: dict[int, int] = {}
@@ -52,87 +56,394 @@ def _score_5(cards: list[Card]) -> tuple[HandRank, tuple[int, ...], str]:
 
     # Straight Flush
     if is_flush and is_straight:
-        hr = HandRank.STRAIGHT_FLUSH
-        tb = (straight_high,)
-        desc = f"{HAND_RANK_NAME[hr]} ({straight_high}-high)"
-        return (hr, tb, desc)
+        return (HandRank.STRAIGHT_FLUSH, (straight_high,))
 
     # Four of a Kind
     if groups[0][0] == 4:
         quad = groups[0][1]
         kicker = max(v for v in vals if v != quad)
-        hr = HandRank.FOUR_OF_A_KIND
-        tb = (quad, kicker)
-        desc = f"{HAND_RANK_NAME[hr]} ({_r(quad)}s, with a {_r(kicker)} kicker.)"
-        return (hr, tb, desc)
+        return (HandRank.FOUR_OF_A_KIND, (quad, kicker))
 
     # Full House
     if groups[0][0] == 3 and len(groups) > 1 and groups[1][0] >= 2:
-        trips = groups[0][1]
-        pair = groups[1][1]
-        hr = HandRank.FULL_HOUSE
-        tb = (trips, pair)
-        desc = f"{HAND_RANK_NAME[hr]} ({trips}s full of {pair}s)"
-        return (hr, tb, desc)
+        return (HandRank.FULL_HOUSE, (groups[0][1], groups[1][1]))
 
     # Flush
     if is_flush:
-        hr = HandRank.FLUSH
-        tb = tuple(vals)
-        desc = f"{HAND_RANK_NAME[hr]} ({' '.join(_r(v) for v in vals)})"
-        return (hr, tb, desc)
+        return (HandRank.FLUSH, tuple(vals))
 
     # Straight
     if is_straight:
-        hr = HandRank.STRAIGHT
-        tb = (straight_high,)
-        desc = f"{HAND_RANK_NAME[hr]} ({straight_high}-high)"
-        return (hr, tb, desc)
+        return (HandRank.STRAIGHT, (straight_high,))
 
     # Three of a Kind
     if groups[0][0] == 3:
         trips = groups[0][1]
         kickers = sorted((v for v in vals if v != trips), reverse=True)[:2]
-        hr = HandRank.THREE_OF_A_KIND
-        tb = (trips, *kickers)
-        desc = f"{HAND_RANK_NAME[hr]} ({_r(trips)}s, with {' '.join(_r(v) for v in kickers)} kickers.)"
-        return (hr, tb, desc)
+        return (HandRank.THREE_OF_A_KIND, (trips, *kickers))
 
     # Two Pair
     if groups[0][0] == 2 and len(groups) > 1 and groups[1][0] == 2:
         pair_hi = max(groups[0][1], groups[1][1])
         pair_lo = min(groups[0][1], groups[1][1])
         kicker = max(v for v in vals if v != pair_hi and v != pair_lo)
-        hr = HandRank.TWO_PAIR
-        tb = (pair_hi, pair_lo, kicker)
-        desc = f"{HAND_RANK_NAME[hr]} ({_r(pair_hi)}s and {_r(pair_lo)}s, with a {_r(kicker)} kicker.)"
-        return (hr, tb, desc)
+        return (HandRank.TWO_PAIR, (pair_hi, pair_lo, kicker))
 
     # One Pair
     if groups[0][0] == 2:
         pair = groups[0][1]
         kickers = sorted((v for v in vals if v != pair), reverse=True)[:3]
-        hr = HandRank.ONE_PAIR
-        tb = (pair, *kickers)
-        desc = f"{HAND_RANK_NAME[hr]} ({_r(pair)}s, with {' '.join(_r(v) for v in kickers)} kickers.)"
-        return (hr, tb, desc)
+        return (HandRank.ONE_PAIR, (pair, *kickers))
 
     # High Card
-    hr = HandRank.HIGH_CARD
-    tb = tuple(vals)
-    desc = f"{HAND_RANK_NAME[hr]} ({' '.join(_r(v) for v in vals)})"
-    return (hr, tb, desc)
-
-
-def best_of_7(cards7: Iterable[Card]) -> tuple[HandRank, tuple[int, ...], str]:
-    best: tuple[HandRank, tuple[int, ...], str] | None = None
-    cards = list(cards7)
-    for combo in combinations(cards, 5):
-        scored = _score_5(list(combo))
-        if best is None:
-            best = scored
+    return (HandRank.HIGH_CARD, tuple(vals))
+
+
+def _describe(hr: HandRank, tb: tuple[int, ...]) -> str:
+    """
+    Human-readable description of a (rank, tiebreakers) pair. Formatting is
+    deferred to display time -- evaluation and the table build never pay for
+    it -- and memoised per class by _class_desc below.
+    """
+    name = HAND_RANK_NAME[hr]
+    if hr in (HandRank.STRAIGHT_FLUSH, HandRank.STRAIGHT):
+        return f"{name} ({tb[0]}-high)"
+    if hr == HandRank.FOUR_OF_A_KIND:
+        return f"{name} ({_r(tb[0])}s, with a {_r(tb[1])} kicker.)"
+    if hr == HandRank.FULL_HOUSE:
+        return f"{name} ({tb[0]}s full of {tb[1]}s)"
+    if hr in (HandRank.FLUSH, HandRank.HIGH_CARD):
+        return f"{name} ({' '.join(_r(v) for v in tb)})"
+    if hr == HandRank.THREE_OF_A_KIND:
+        return f"{name} ({_r(tb[0])}s, with {' '.join(_r(v) for v in tb[1:])} kickers.)"
+    if hr == HandRank.TWO_PAIR:
+        return f"{name} ({_r(tb[0])}s and {_r(tb[1])}s, with a {_r(tb[2])} kicker.)"
+    # One Pair
+    return f"{name} ({_r(tb[0])}s, with {' '.join(_r(v) for v in tb[1:])} kickers.)"
+
+
+def _build_tables() -> tuple[
+    list[int], list[int], dict[int, int], list[tuple[HandRank, tuple[int, ...]]]
+]:
+    """
+    Enumerate all 7462 distinct 5-card hand strengths (equivalence classes)
+    and index them three ways:
+
+      - _FLUSH_CLASS[rank_bits]   for five suited cards (8192-entry list)
+      - _UNIQUE5_CLASS[rank_bits] for five distinct, unsuited ranks
+      - _PRIME_CLASS[prime_prod]  for every non-flush hand (repeated-rank
+        hands have no other key; distinct-rank hands are indexed here too
+        so the 7-card prime-division path needs only this one dict)
+
+    Classes are numbered 1..7462 with HIGHER = better, matching how
+    (HandRank, tiebreaker) tuples already compare in this codebase.
+    """
+    entries: list[tuple[tuple[HandRank, tuple[int, ...]], str, object]] = []
+
+    # Five distinct ranks: both the suited (flush/straight-flush) and the
+    # unsuited (straight/high-card) reading of each rank set.
+    for ridx in combinations(range(13), 5):
+        vals = sorted((i + 2 for i in ridx), reverse=True)
+        rank_bits = sum(1 << i for i in ridx)
+        prime = 1
+        for i in ridx:
+            prime *= PRIMES[i]
+        entries.append((_score_ranks(vals, True), "flush", rank_bits))
+        entries.append((_score_ranks(vals, False), "unique", (rank_bits, prime)))
+
+    # Rank multisets with at least one repeat (pairs through quads). These can
+    # never be flushes, and the prime product identifies the multiset.
+    for ridx in combinations_with_replacement(range(13), 5):
+        uniq = set(ridx)
+        if len(uniq) == 5:
+            continue
+        if any(ridx.count(i) > 4 for i in uniq):
+            continue  # five of a kind is impossible
+        vals = sorted((i + 2 for i in ridx), reverse=True)
+        prime = 1
+        for i in ridx:
+            prime *= PRIMES[i]
+        entries.append((_score_ranks(vals, False), "prime", prime))
+
+    # Sort weakest -> strongest and hand out class numbers.
+    entries.sort(key=lambda e: e[0])
+
+    flush_cls = [0] * 8192
+    unique5_cls = [0] * 8192
+    prime_cls: dict[int, int] = {}
+    info: list[tuple[HandRank, tuple[int, ...]]] = [(HandRank.HIGH_CARD, ())]
+
+    for cls, (scored, kind, key) in enumerate(entries, start=1):
+        info.append(scored)
+        if kind == "flush":
+            flush_cls[key] = cls
+        elif kind == "unique":
+            # Indexed both ways: by rank OR-mask for _eval5 and by prime
+            # product so the 7-card path below can key every non-flush
+            # hand through the one dict.
+            unique5_cls[key[0]] = cls
+            prime_cls[key[1]] = cls
+        else:
+            prime_cls[key] = cls
+
+    return flush_cls, unique5_cls, prime_cls, info
+
+
+_FLUSH_CLASS, _UNIQUE5_CLASS, _PRIME_CLASS, _CLASS_INFO = _build_tables()
+
+
+def _eval5(c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+    """Rank class (1..7462, higher = better) of five packed-int cards."""
+    if c0 & c1 & c2 & c3 & c4 & 0xF000:
+        return _FLUSH_CLASS[(c0 | c1 | c2 | c3 | c4) >> 16]
+    cls = _UNIQUE5_CLASS[(c0 | c1 | c2 | c3 | c4) >> 16]
+    if cls:
+        return cls
+    return _PRIME_CLASS[(c0 & 0x3F) * (c1 & 0x3F) * (c2 & 0x3F) * (c3 & 0x3F) * (c4 & 0x3F)]
+
+
+# The 21 pairs of positions to EXCLUDE when picking 5 cards out of 7,
+# hardcoded so _best7_py avoids the combinations() iterator per call.
+_C7_2 = tuple(combinations(range(7), 2))
+
+
+def _best7_py(codes: list[int]) -> int:
+    """
+    Best class of seven packed-int cards from once-per-hand partials.
+
+    One pass accumulates per-suit rank masks and the whole-hand prime
+    product; the 21 combinations are then derived by exclusion (divide out
+    the two skipped primes) instead of rebuilt from five cards each.
+    """
+    suit_ranks = [0, 0, 0, 0]
+    prime = 1
+    for c in codes:
+        suit_ranks[((c >> 12) & 0xF).bit_length() - 1] |= c >> 16
+        prime *= c & 0x3F
+
+    # With five or more of one suit, quads and full houses are impossible
+    # (they need three off-suit cards and only two exist), so the best hand
+    # is the best flush drawn from that suit alone.
+    for mask in suit_ranks:
+        n = mask.bit_count()
+        if n < 5:
             continue
-        if (scored[0], scored[1]) > (best[0], best[1]):
-            best = scored
-    assert best is not None
-    return best
\ No newline at end of file
+        if n == 5:
+            return _FLUSH_CLASS[mask]
+        best = 0
+        bits = [1 << i for i in range(13) if mask & (1 << i)]
+        for drop in combinations(bits, n - 5):
+            m = mask
+            for b in drop:
+                m ^= b
+            cls = _FLUSH_CLASS[m]
+            if cls > best:
+                best = cls
+        return best
+
+    best = 0
+    for i, j in _C7_2:
+        cls = _PRIME_CLASS[prime // ((codes[i] & 0x3F) * (codes[j] & 0x3F))]
+        if cls > best:
+            best = cls
+    return best
+
+
+# Optional Numba acceleration: JIT-compile the 7-card kernel when numba is
+# installed. Purely opportunistic -- the pure-Python path below is always
+# available and numba is deliberately not a requirement of this game.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+    from numba.core import types as _nb_types
+    from numba.typed import Dict as _NumbaDict
+except ImportError:
+    _best7_jit = None
+    jit_equity_wins = None
+else:
+    _FLUSH_NP = _np.array(_FLUSH_CLASS, dtype=_np.int64)
+    _UNIQUE5_NP = _np.array(_UNIQUE5_CLASS, dtype=_np.int64)
+    _PRIME_TD = _NumbaDict.empty(key_type=_nb_types.int64, value_type=_nb_types.int64)
+    for _k, _v in _PRIME_CLASS.items():
+        _PRIME_TD[_k] = _v
+
+    @_njit(cache=True)
+    def _best7_jit(codes, flush_tbl, unique_tbl, prime_tbl):  # pragma: no cover
+        best = 0
+        for i in range(6):
+            for j in range(i + 1, 7):
+                # The five cards excluding positions i and j
+                or_acc = 0
+                and_acc = -1
+                prime = 1
+                for k in range(7):
+                    if k == i or k == j:
+                        continue
+                    c = codes[k]
+                    or_acc |= c
+                    and_acc &= c
+                    prime *= c & 0x3F
+                if and_acc & 0xF000:
+                    cls = flush_tbl[or_acc >> 16]
+                else:
+                    cls = unique_tbl[or_acc >> 16]
+                    if cls == 0:
+                        cls = prime_tbl[prime]
+                if cls > best:
+                    best = cls
+        return best
+
+    @_njit(cache=True)
+    def _equity_rows_jit(h0, h1, comm, rows, flush_tbl, unique_tbl, prime_tbl):  # pragma: no cover
+        """
+        Count hero wins/ties over pre-sampled villain+board rows without
+        returning to the interpreter between evaluations. comm holds the
+        known board (may be short of 5); each row is two villain cards
+        followed by the cards completing the board.
+        """
+        m = comm.shape[0]
+        hero = _np.empty(7, _np.int64)
+        vill = _np.empty(7, _np.int64)
+        hero[0] = h0
+        hero[1] = h1
+        for t in range(m):
+            hero[2 + t] = comm[t]
+            vill[2 + t] = comm[t]
+        wins = 0
+        for r in range(rows.shape[0]):
+            vill[0] = rows[r, 0]
+            vill[1] = rows[r, 1]
+            for t in range(rows.shape[1] - 2):
+                hero[2 + m + t] = rows[r, 2 + t]
+                vill[2 + m + t] = rows[r, 2 + t]
+            if _best7_jit(hero, flush_tbl, unique_tbl, prime_tbl) >= _best7_jit(
+                vill, flush_tbl, unique_tbl, prime_tbl
+            ):
+                wins += 1
+        return wins
+
+    def jit_equity_wins(h0: int, h1: int, comm: list[int], rows) -> int:
+        """Hero win/tie count for an (iters, 2+need) int64 row matrix."""
+        return int(_equity_rows_jit(
+            h0, h1, _np.asarray(comm, dtype=_np.int64), rows,
+            _FLUSH_NP, _UNIQUE5_NP, _PRIME_TD,
+        ))
+
+    # Warm the JIT once at import so the first CPU decision doesn't stall.
+    _best7_jit(_np.array(CARD_CODES[:7], dtype=_np.int64), _FLUSH_NP, _UNIQUE5_NP, _PRIME_TD)
+    jit_equity_wins(CARD_CODES[0], CARD_CODES[1], list(CARD_CODES[2:5]),
+                    _np.array([CARD_CODES[5:9]], dtype=_np.int64))
+
+
+def _best_class(codes: list[int]) -> int:
+    """Best 5-card rank class reachable from 5, 6 or 7 packed-int cards."""
+    n = len(codes)
+    if n == 5:
+        return _eval5(codes[0], codes[1], codes[2], codes[3], codes[4])
+    if n == 7 and _best7_jit is not None:
+        return int(_best7_jit(_np.asarray(codes, dtype=_np.int64), _FLUSH_NP, _UNIQUE5_NP, _PRIME_TD))
+    if n == 7:
+        return _best7_py(codes)
+    best = 0
+    for c0, c1, c2, c3, c4 in combinations(codes, 5):
+        cls = _eval5(c0, c1, c2, c3, c4)
+        if cls > best:
+            best = cls
+    return best
+
+
+JIT_AVAILABLE = _best7_jit is not None
+
+# Subsets of a 5-card board used by the shared-board evaluation below.
+_C5_4 = tuple(combinations(range(5), 4))
+_C5_3 = tuple(combinations(range(5), 3))
+
+
+def board_eval_cache(
+    board5: list[int],
+) -> tuple[int, list[tuple[int, int, int]], list[tuple[int, int, int]]]:
+    """
+    Precompute the board-only rank class plus (OR, AND, prime) accumulators
+    for every 4- and 3-card subset of a full 5-card board. Hands sharing the
+    board (hero and villain in the equity loop) then score their two hole
+    cards against these partials instead of rebuilding all 21 combos.
+    """
+    b0, b1, b2, b3, b4 = board5
+    board_cls = _eval5(b0, b1, b2, b3, b4)
+    quads = []
+    for i0, i1, i2, i3 in _C5_4:
+        c0, c1, c2, c3 = board5[i0], board5[i1], board5[i2], board5[i3]
+        quads.append((
+            c0 | c1 | c2 | c3,
+            c0 & c1 & c2 & c3,
+            (c0 & 0x3F) * (c1 & 0x3F) * (c2 & 0x3F) * (c3 & 0x3F),
+        ))
+    triples = []
+    for i0, i1, i2 in _C5_3:
+        c0, c1, c2 = board5[i0], board5[i1], board5[i2]
+        triples.append((
+            c0 | c1 | c2,
+            c0 & c1 & c2,
+            (c0 & 0x3F) * (c1 & 0x3F) * (c2 & 0x3F),
+        ))
+    return (board_cls, quads, triples)
+
+
+def best_class_with_board(
+    cache: tuple[int, list[tuple[int, int, int]], list[tuple[int, int, int]]],
+    h1: int,
+    h2: int,
+) -> int:
+    """
+    Best 7-card class for two hole cards against a board precomputed by
+    board_eval_cache. Each of the 20 hole-involving combos costs a handful of
+    integer ops on the cached partials (the board-only combo is free).
+    """
+    best = cache[0]
+    h_or = h1 | h2
+    h_and = h1 & h2
+    h_pr = (h1 & 0x3F) * (h2 & 0x3F)
+    for por, pand, ppr in cache[2]:  # 3 board cards + both hole cards
+        o = por | h_or
+        if pand & h_and & 0xF000:
+            cls = _FLUSH_CLASS[o >> 16]
+        else:
+            cls = _UNIQUE5_CLASS[o >> 16] or _PRIME_CLASS[ppr * h_pr]
+        if cls > best:
+            best = cls
+    for por, pand, ppr in cache[1]:  # 4 board cards + one hole card
+        for h in (h1, h2):
+            o = por | h
+            if pand & h & 0xF000:
+                cls = _FLUSH_CLASS[o >> 16]
+            else:
+                cls = _UNIQUE5_CLASS[o >> 16] or _PRIME_CLASS[ppr * (h & 0x3F)]
+            if cls > best:
+                best = cls
+    return best
+
+
+def class_rank_info(cls: int) -> tuple[HandRank, tuple[int, ...]]:
+    """HandRank and tiebreakers for a rank class from best_class."""
+    return _CLASS_INFO[cls]
+
+
+@lru_cache(maxsize=None)
+def _class_desc(cls: int) -> str:
+    if cls == 0:
+        return "N/A"
+    return _describe(*_CLASS_INFO[cls])
+
+
+def best_class(cards: Iterable[Card | int]) -> int:
+    """
+    Comparable int strength (higher = better) of the best 5-card hand.
+    Cheaper than best_of_7 when only the ordering matters (Monte Carlo).
+    """
+    return _best_class(_to_codes(cards))
+
+
+def best_of_7(cards7: Iterable[Card | int]) -> tuple[HandRank, tuple[int, ...], str]:
+    cls = _best_class(_to_codes(cards7))
+    hr, tb = _CLASS_INFO[cls]
+    return (hr, tb, _class_desc(cls))
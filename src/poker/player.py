@@ -1,15 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List
-from src.poker.card import Card
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     chips: int = 1000
-    hand: List[Card] = field(default_factory=list)
+    hand: List[int] = field(default_factory=list)  # packed card codes (see card.py)
     folded: bool = False
 
     def reset_for_hand(self) -> None:
         self.hand.clear()
-        self.folded = False
\ No newline at end of file
+        self.folded = False
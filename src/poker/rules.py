@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
+from itertools import accumulate
 from typing import Iterable
 
 
@@ -85,10 +87,14 @@ class BlindStructure:
     """
     levels: list[BlindLevel]
     _hand_index: int = 0  # 0-based "hands played in this game"
+    _cum_hands: list[int] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         if not self.levels:
             raise ValueError("BlindStructure must have at least one level.")
+        # Cumulative hand counts per level, so level lookup is a bisect
+        # instead of summing the schedule every call.
+        self._cum_hands = list(accumulate(l.hands_per_level for l in self.levels))
 
     def start_new_game(self) -> None:
         self._hand_index = 0
@@ -107,13 +113,8 @@ class BlindStructure:
         # Example: hands_per_level=5
         # hand_index=0 (0 hands played) => next hand is #1 => level 0
         # after advance_hand: _hand_index=1 => still level 0
-        hands_played = self._hand_index
-        total = 0
-        for i, lvl in enumerate(self.levels):
-            total += lvl.hands_per_level
-            if hands_played <= total:
-                return i
-        return len(self.levels) - 1  # cap at last level
+        idx = bisect_left(self._cum_hands, self._hand_index)
+        return min(idx, len(self.levels) - 1)  # cap at last level
 
     def current_blinds(self) -> tuple[int, int]:
         lvl = self.levels[self.current_level_index()]
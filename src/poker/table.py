@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from array import array
 from typing import List, Dict
 from dataclasses import dataclass
-import random
+import time
+
+import numpy as np
 
 from src.poker.deck import Deck
 from src.poker.player import Player
 from src.poker.cpu import CPUPlayer, CPUPersonality
-from src.poker.card import Card
+from src.poker.card import code_short_name
 from src.poker.rules import TexasHoldemRules, default_blind_structure, Street, Action
 
 
@@ -17,6 +20,17 @@ class PokerTable:
     NOTE: side pots / split pots are not implemented yet (all-ins are “safe” but not fully correct).
     """
 
+    # Fixed attribute set: slot descriptors replace per-access __dict__
+    # hashing in the hot action/turn/update paths.
+    __slots__ = (
+        "rules", "blinds", "deck", "players", "community", "hand_number",
+        "_n", "_next", "_prev", "big_blind_index", "street",
+        "pot", "current_bets", "current_bet_amount",
+        "hand_active", "to_act_index", "alive_mask", "pending_mask",
+        "_ai_deadline", "sb_amount", "bb_amount",
+        "last_action", "last_actions", "showdown_summary", "_rng",
+    )
+
     def __init__(self) -> None:
         self.rules = TexasHoldemRules()
         self.blinds = default_blind_structure(small_blind=10, big_blind=20, hands_per_level=5)
@@ -30,38 +44,54 @@ class PokerTable:
             CPUPlayer("AI-4", chips=self.rules.starting_chips, personality=CPUPersonality.NEUTRAL),
         ]
 
-        self.community: List[Card] = []
+        self.community: List[int] = []  # packed card codes (see card.py)
         self.hand_number = 0
 
+        # Seat count is fixed for the life of the table, so rotation is a
+        # tuple lookup instead of a modulo per call.
+        self._n = len(self.players)
+        self._next = tuple((i + 1) % self._n for i in range(self._n))
+        self._prev = tuple((i - 1) % self._n for i in range(self._n))
+
         # Positions / round state
         self.big_blind_index: int = 0  # NEW GAME: "You" starts as Big Blind
         self.street: Street = Street.PRE_FLOP
 
-        # Betting bookkeeping (per street)
+        # Betting bookkeeping (per street). current_bets is a fixed-size
+        # per-seat array; current_bet_amount is maintained incrementally as
+        # bets land instead of re-scanned with max().
         self.pot: int = 0
-        self.current_bets: Dict[int, int] = {}  # seat_index -> amount in current street
+        self.current_bets = array("q", [0] * len(self.players))
         self.current_bet_amount: int = 0
 
-        # Turn engine
+        # Turn engine. Seats are tracked as bitmasks (bit i = seat i):
+        # alive_mask = not folded, pending_mask = still owes an action this
+        # street. Next-actor selection is then a rotate + lowest-set-bit
+        # instead of a per-seat scan, and aggression rebuilds pending with
+        # one assignment instead of a new set.
         self.hand_active: bool = False
         self.to_act_index: int | None = None
-        self.pending_to_act: set[int] = set()
+        self.alive_mask: int = (1 << len(self.players)) - 1
+        self.pending_mask: int = 0
 
-        # AI “thinking”
-        self._ai_timer: float = 0.0
+        # AI “thinking”: wall-clock deadline for the seat currently thinking
+        self._ai_deadline: float | None = None
 
         # Cached blinds for the current hand (used by AI sizing / min-raise)
         self.sb_amount: int = 10
         self.bb_amount: int = 20
 
-        # Optional: helpful for UI/debug
-        self.last_action_text: str = ""
-        self.last_actions: Dict[int, str] = {}  # seat_index -> short action string for UI
+        # Optional: helpful for UI/debug. Actions are stored as compact
+        # tuples and only formatted into strings when something displays
+        # them (last_action_text / seat_action_text), so rapid AI turns
+        # never pay for f-strings nobody reads.
+        self.last_action: tuple | None = None
+        self.last_actions: Dict[int, tuple] = {}  # seat_index -> action tuple for UI
         
         # Showdown / results (for UI)
         self.showdown_summary: dict | None = None
 
-        self._rng = random.Random()
+        self._rng = np.random.default_rng()
 
     # ---------- Game lifecycle ----------
 
@@ -86,13 +116,13 @@ class PokerTable:
             p.reset_for_hand()
 
         if self.hand_number > 1:
-            self.big_blind_index = (self.big_blind_index + 1) % len(self.players)
+            self.big_blind_index = self._next[self.big_blind_index]
 
         self._post_blinds()
 
         # Deal 2 hole cards each, starting left of dealer (standard)
         dealer = self.dealer_index()
-        first_to_receive = (dealer + 1) % len(self.players)
+        first_to_receive = self._next[dealer]
         self._deal_hole_cards(start_index=first_to_receive)
 
         # Start preflop betting (UTG = left of BB)
@@ -105,36 +135,42 @@ class PokerTable:
         self.street = Street.PRE_FLOP
 
         self.pot = 0
-        self.current_bets.clear()
+        for i in range(self._n):
+            self.current_bets[i] = 0
         self.current_bet_amount = 0
 
         self.hand_active = False
         self.to_act_index = None
-        self.pending_to_act.clear()
-        self._ai_timer = 0.0
-        self.last_action_text = ""
+        self.alive_mask = (1 << len(self.players)) - 1
+        self.pending_mask = 0
+        self._ai_deadline = None
+        self.last_action = None
         self.last_actions.clear()
         self.showdown_summary = None
 
     # ---------- Position helpers ----------
 
     def small_blind_index(self) -> int:
-        return (self.big_blind_index - 1) % len(self.players)
+        return self._prev[self.big_blind_index]
 
     def dealer_index(self) -> int:
-        return (self.small_blind_index() - 1) % len(self.players)
+        return self._prev[self.small_blind_index()]
 
     def _next_seat(self, seat_index: int) -> int:
-        return (seat_index + 1) % len(self.players)
+        return self._next[seat_index]
 
     # ---------- Dealing / blinds ----------
 
     def _deal_hole_cards(self, start_index: int) -> None:
-        for _ in range(self.rules.hole_cards):
-            idx = start_index
-            for _ in range(len(self.players)):
-                self.players[idx].hand.append(self.deck.draw())
-                idx = self._next_seat(idx)
+        # One batched draw; seat s sits (s - start) laps into the round-robin
+        # order, so its cards are one deck-stride apart. Each hand list is
+        # refilled with a single slice assignment, reusing the list object
+        # instead of growing it append by append.
+        n = self._n
+        cards = self.deck.draw_many(self.rules.hole_cards * n)
+        for s, p in enumerate(self.players):
+            pos = (s - start_index) % n
+            p.hand[:] = cards[pos::n]
 
     def _burn(self) -> None:
         if self.deck.remaining() > 0:
@@ -161,20 +197,30 @@ class PokerTable:
         self.current_bets[sb_seat] = sb_paid
         self.current_bets[bb_seat] = bb_paid
         self.pot += sb_paid + bb_paid
-        self.current_bet_amount = max(self.current_bets.values(), default=0)
+        self.current_bet_amount = max(sb_paid, bb_paid)
 
-        self.last_action_text = f"Posted blinds: SB {self.sb_amount} (seat {sb_seat}), BB {self.bb_amount} (seat {bb_seat})"
+        self.last_action = ("blinds", self.sb_amount, sb_seat, self.bb_amount, bb_seat)
 
     # ---------- Betting / actions ----------
 
     def active_seats(self) -> list[int]:
-        return [i for i, p in enumerate(self.players) if not p.folded]
+        m = self.alive_mask
+        return [i for i in range(len(self.players)) if (m >> i) & 1]
 
     def seats_can_act(self) -> list[int]:
-        return [i for i in self.active_seats() if self.players[i].chips > 0]
+        m = self._can_act_mask()
+        return [i for i in range(len(self.players)) if (m >> i) & 1]
+
+    def _can_act_mask(self) -> int:
+        mask = 0
+        alive = self.alive_mask
+        for i, p in enumerate(self.players):
+            if (alive >> i) & 1 and p.chips > 0:
+                mask |= 1 << i
+        return mask
 
     def to_call(self, seat_index: int) -> int:
-        return max(0, self.current_bet_amount - self.current_bets.get(seat_index, 0))
+        return max(0, self.current_bet_amount - self.current_bets[seat_index])
 
     def human_can_act(self) -> bool:
         return self.hand_active and self.to_act_index == 0 and not self.players[0].folded and self.players[0].chips >= 0
@@ -191,7 +237,7 @@ class PokerTable:
             return
 
         call_amt = self.to_call(seat_index)
-        prev_bet = self.current_bets.get(seat_index, 0)
+        prev_bet = self.current_bets[seat_index]
 
         # Helper: put chips in so that seat's total street bet becomes `target_total`
         def bet_to(target_total: int) -> int:
@@ -204,21 +250,22 @@ class PokerTable:
             self.pot += paid
             self.current_bets[seat_index] = prev_bet + paid
             prev_bet = self.current_bets[seat_index]
-            self.current_bet_amount = max(self.current_bets.values(), default=0)
+            if prev_bet > self.current_bet_amount:
+                self.current_bet_amount = prev_bet
             return paid
 
         # --- Resolve action ---
         if action == Action.FOLD:
             self.players[seat_index].folded = True
-            self.last_action_text = f"{self.players[seat_index].name} folds"
-            self.last_actions[seat_index] = "Folded"
-            # folded player no longer pending
-            self.pending_to_act.discard(seat_index)
+            self.last_action = ("fold", seat_index)
+            self.last_actions[seat_index] = ("fold",)
+            # folded player no longer alive or pending
+            self.alive_mask &= ~(1 << seat_index)
+            self.pending_mask &= ~(1 << seat_index)
 
             # if only one remains, award pot and end hand
-            alive = self.active_seats()
-            if len(alive) == 1:
-                self._award_pot(alive[0])
+            if self.alive_mask & (self.alive_mask - 1) == 0:
+                self._award_pot(self.alive_mask.bit_length() - 1)
                 return
 
             self._advance_turn(from_seat=seat_index)
@@ -228,13 +275,13 @@ class PokerTable:
             if call_amt > 0:
                 # CHECK becomes CALL when facing a bet
                 paid = bet_to(prev_bet + call_amt)
-                self.last_action_text = f"{self.players[seat_index].name} calls {paid}"
-                self.last_actions[seat_index] = f"Called {paid}"
+                self.last_action = ("call", seat_index, paid)
+                self.last_actions[seat_index] = ("call", paid)
             else:
-                self.last_action_text = f"{self.players[seat_index].name} checks"
-                self.last_actions[seat_index] = "Checked"
+                self.last_action = ("check", seat_index)
+                self.last_actions[seat_index] = ("check",)
 
-            self.pending_to_act.discard(seat_index)
+            self.pending_mask &= ~(1 << seat_index)
             self._advance_turn(from_seat=seat_index)
             return
 
@@ -250,24 +297,23 @@ class PokerTable:
             target = min(target, max_total)
 
             paid = bet_to(target)
-            new_total = self.current_bets.get(seat_index, 0)
+            new_total = self.current_bets[seat_index]
 
             if action == Action.BET:
-                self.last_action_text = f"{self.players[seat_index].name} bets {paid}"
-                self.last_actions[seat_index] = f"Bet {paid}"
+                self.last_action = ("bet", seat_index, paid)
+                self.last_actions[seat_index] = ("bet", paid)
             else:
-                self.last_action_text = f"{self.players[seat_index].name} raises to {new_total} (+{paid})"
-                self.last_actions[seat_index] = f"Raised +{paid} (to {new_total})"
+                self.last_action = ("raise", seat_index, paid, new_total)
+                self.last_actions[seat_index] = ("raise", paid, new_total)
 
             # If this didn't increase the table bet (e.g., all-in short), treat it like a call
-            if self.current_bets.get(seat_index, 0) <= self.current_bet_amount and paid <= call_amt:
-                self.pending_to_act.discard(seat_index)
+            if new_total <= self.current_bet_amount and paid <= call_amt:
+                self.pending_mask &= ~(1 << seat_index)
                 self._advance_turn(from_seat=seat_index)
                 return
 
             # Aggressive action: everyone else who can act becomes pending again
-            self.pending_to_act = set(self.seats_can_act())
-            self.pending_to_act.discard(seat_index)
+            self.pending_mask = self._can_act_mask() & ~(1 << seat_index)
 
             self._advance_turn(from_seat=seat_index)
             return
@@ -275,36 +321,36 @@ class PokerTable:
     def _begin_betting_round(self) -> None:
         # Decide first to act
         if self.street == Street.PRE_FLOP:
-            first = (self.big_blind_index + 1) % len(self.players)  # UTG
+            first = self._next[self.big_blind_index]  # UTG
         else:
-            first = (self.dealer_index() + 1) % len(self.players)  # SB
+            first = self._next[self.dealer_index()]  # SB
 
-        self.pending_to_act = set(self.seats_can_act())
+        self.pending_mask = self._can_act_mask()
         self.to_act_index = first
-        self._ai_timer = 0.0
+        self._ai_deadline = None
 
         # If first seat can't act (folded/all-in), advance immediately
-        if self.to_act_index not in self.pending_to_act:
-            self._advance_turn(from_seat=(first - 1) % len(self.players))
+        if not (self.pending_mask >> first) & 1:
+            self._advance_turn(from_seat=self._prev[first])
 
     def _advance_turn(self, *, from_seat: int) -> None:
         # If betting round ended, advance street
-        if not self.pending_to_act:
+        if not self.pending_mask:
             self._on_betting_round_complete()
             return
 
-        n = len(self.players)
-        idx = from_seat
-        for _ in range(n):
-            idx = (idx + 1) % n
-            if idx in self.pending_to_act and not self.players[idx].folded and self.players[idx].chips > 0:
-                self.to_act_index = idx
-                self._ai_timer = 0.0
-                return
-
-        # No valid next actor -> end betting round
-        self.pending_to_act.clear()
-        self._on_betting_round_complete()
+        # Rotate pending so the seat after from_seat sits at bit 0, then the
+        # lowest set bit is the next actor. Pending seats are alive with
+        # chips by construction, so no per-seat re-check is needed.
+        n = self._n
+        rot = ((self.pending_mask >> (from_seat + 1))
+               | (self.pending_mask << (n - from_seat - 1))) & ((1 << n) - 1)
+        if rot == 0:
+            self._on_betting_round_complete()
+            return
+        idx = from_seat + (rot & -rot).bit_length()
+        self.to_act_index = idx if idx < n else idx - n
+        self._ai_deadline = None
 
     def _on_betting_round_complete(self) -> None:
         # If only one remains, end immediately
@@ -334,7 +380,8 @@ class PokerTable:
             return
 
         # New street: reset bets
-        self.current_bets.clear()
+        for i in range(self._n):
+            self.current_bets[i] = 0
         self.current_bet_amount = 0
 
         self._begin_betting_round()
@@ -342,37 +389,39 @@ class PokerTable:
     def _award_pot(self, winner_seat: int) -> None:
         winner = self.players[winner_seat]
         winner.chips += self.pot
-        self.last_action_text = f"{winner.name} wins pot {self.pot}"
+        self.last_action = ("win", winner_seat, self.pot)
         self.pot = 0
         self.hand_active = False
         self.to_act_index = None
-        self.pending_to_act.clear()
+        self.pending_mask = 0
 
     def _showdown_placeholder(self) -> None:
         from src.poker.hand_evaluator import best_of_7
+        from src.poker.rules import HandRank, HAND_RANK_NAME
+
+        # Reveal/evaluate ALL players (including folded), as requested.
+        # Hands and board are already packed ints; each seat's evaluation is
+        # its two hole codes against the shared board list.
+        board_ready = len(self.community) >= 3
 
-        # Reveal/evaluate ALL players (including folded), as requested
         rows: list[dict] = []
         best_by_seat: dict[int, tuple] = {}
 
         for i, p in enumerate(self.players):
-            seven = list(p.hand) + list(self.community)
-            if len(p.hand) == 2 and len(self.community) >= 3:
-                hr, tb, desc = best_of_7(seven)
+            if len(p.hand) == 2 and board_ready:
+                hr, tb, desc = best_of_7(p.hand + self.community)
             else:
                 # if somehow incomplete, treat as lowest
-                from src.poker.rules import HandRank
                 hr, tb, desc = (HandRank.HIGH_CARD, (), "N/A")
 
             best_by_seat[i] = (hr, tb, desc)
-            from src.poker.rules import HAND_RANK_NAME  # add at top of method, or keep here
 
             rows.append(
                 {
                     "seat": i,
                     "name": p.name,
                     "folded": p.folded,
-                    "cards": [c.short_name() for c in p.hand],
+                    "cards": [code_short_name(c) for c in p.hand],
                     "hand_name": HAND_RANK_NAME[hr],
                     "hand_desc": desc,  # full detail (kickers, ordering, etc.)
                     "rank": int(hr) if isinstance(hr, int) else 0,
@@ -400,30 +449,69 @@ class PokerTable:
         # Award pot after capturing summary
         self._award_pot(winner_seat)
 
+    # ---------- Display helpers ----------
+
+    @property
+    def last_action_text(self) -> str:
+        """Human-readable form of last_action, built only when displayed."""
+        a = self.last_action
+        if a is None:
+            return ""
+        kind = a[0]
+        if kind == "blinds":
+            return f"Posted blinds: SB {a[1]} (seat {a[2]}), BB {a[3]} (seat {a[4]})"
+        name = self.players[a[1]].name
+        if kind == "fold":
+            return f"{name} folds"
+        if kind == "check":
+            return f"{name} checks"
+        if kind == "call":
+            return f"{name} calls {a[2]}"
+        if kind == "bet":
+            return f"{name} bets {a[2]}"
+        if kind == "raise":
+            return f"{name} raises to {a[3]} (+{a[2]})"
+        return f"{name} wins pot {a[2]}"  # "win"
+
+    def seat_action_text(self, seat_index: int) -> str:
+        """Short per-seat label for the UI, formatted at render time."""
+        a = self.last_actions.get(seat_index)
+        if a is None:
+            return ""
+        kind = a[0]
+        if kind == "fold":
+            return "Folded"
+        if kind == "check":
+            return "Checked"
+        if kind == "call":
+            return f"Called {a[1]}"
+        if kind == "bet":
+            return f"Bet {a[1]}"
+        return f"Raised +{a[1]} (to {a[2]})"  # "raise"
+
     # ---------- Pygame loop integration ----------
 
     def update(self, dt: float) -> None:
-        if not self.hand_active:
-            return
-        if self.to_act_index is None:
-            return
-
-        # Human turn: wait for UI/buttons
-        if self.to_act_index == 0:
+        # Runs every frame: bind the checked state to locals once instead of
+        # repeating attribute loads (seat 0 is the human, who waits on UI).
+        seat = self.to_act_index
+        if seat is None or seat == 0 or not self.hand_active:
             return
 
-        seat = self.to_act_index
         p = self.players[seat]
         if not isinstance(p, CPUPlayer):
             return
 
-        # Non-blocking “thinking” delay
-        if self._ai_timer <= 0.0:
-            self._ai_timer = p.sample_think_time()
-
-        self._ai_timer -= dt
-        if self._ai_timer > 0.0:
+        # Non-blocking “thinking” delay: sample once per decision, then just
+        # compare against the deadline instead of mutating a countdown per frame.
+        deadline = self._ai_deadline
+        now = time.monotonic()
+        if deadline is None:
+            self._ai_deadline = now + p.sample_think_time()
+            return
+        if now < deadline:
             return
+        self._ai_deadline = None
 
         call_amt = self.to_call(seat)
         action, raise_to = p.choose_action(
@@ -446,7 +534,7 @@ class PokerTable:
             f"Last: {self.last_action_text}",
         ]
         for i, p in enumerate(self.players):
-            hand = " ".join(c.short_name() for c in p.hand) or "(no cards)"
-            bet = self.current_bets.get(i, 0)
+            hand = " ".join(code_short_name(c) for c in p.hand) or "(no cards)"
+            bet = self.current_bets[i]
             parts.append(f"[{i}] {p.name} chips:{p.chips} bet:{bet} folded:{p.folded} hand:{hand}")
         return "    ".join(parts)
\ No newline at end of file
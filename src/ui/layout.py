@@ -1,4 +1,6 @@
 from __future__ import annotations
+from functools import lru_cache
+
 import pygame
 
 def pct_x(w: int, p: float) -> int:
@@ -7,5 +9,12 @@ def pct_x(w: int, p: float) -> int:
 def pct_y(h: int, p: float) -> int:
     return int(h * p)
 
+@lru_cache(maxsize=256)
+def _rect_pct_cached(w: int, h: int, x: float, y: float, rw: float, rh: float) -> pygame.Rect:
+    return pygame.Rect(pct_x(w, x), pct_y(h, y), pct_x(w, rw), pct_y(h, rh))
+
 def rect_pct(w: int, h: int, x: float, y: float, rw: float, rh: float) -> pygame.Rect:
-    return pygame.Rect(pct_x(w, x), pct_y(h, y), pct_x(w, rw), pct_y(h, rh))
\ No newline at end of file
+    # Geometry is memoised per argument tuple (the window size only changes
+    # on resize, so repeat calls hit the cache); callers get a copy because
+    # pygame.Rect is mutable.
+    return _rect_pct_cached(w, h, x, y, rw, rh).copy()
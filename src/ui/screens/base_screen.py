@@ -6,6 +6,21 @@ from typing import Optional
 class Screen(ABC):
     def __init__(self) -> None:
         self._next_screen: Optional["Screen"] = None
+        # GameApp only repaints when this is True; screens set it whenever
+        # their visible state changes (input is handled by GameApp itself).
+        self.needs_redraw: bool = True
+        # Regions the next repaint actually changed. Empty means "whole
+        # frame" (display.flip); screens that know only part of the frame
+        # moved append rects so GameApp can display.update just those.
+        self.dirty_rects: list[pygame.Rect] = []
+
+    @property
+    def is_animating(self) -> bool:
+        """
+        Screens that animate without input override this to True so the main
+        loop keeps polling; otherwise it blocks in pygame.event.wait.
+        """
+        return False
 
     def request_screen_change(self, next_screen: "Screen") -> None:
         self._next_screen = next_screen
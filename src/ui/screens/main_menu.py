@@ -13,6 +13,9 @@ class MainMenuScreen(Screen):
         self.table = table
         self.title = self.ui.font_large.render("Poker", True, self.ui.colors["white"])
 
+        # Title + idle buttons composited once; rebuilt only on resize.
+        self._static: pygame.Surface | None = None
+
         self.btn_play = Button(
             pygame.Rect(540, 320, 200, 60),
             "Play",
@@ -25,6 +28,7 @@ class MainMenuScreen(Screen):
             self.ui.font_medium,
             on_click=self.on_quit,
         )
+        self._buttons = [self.btn_play, self.btn_quit]
 
     def _start_game(self) -> None:
         self.request_screen_change(
@@ -37,13 +41,34 @@ class MainMenuScreen(Screen):
         )
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        self.btn_play.handle_event(event)
-        self.btn_quit.handle_event(event)
+        if event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            return
+        for btn in self._buttons:
+            if btn.handle_event(event):
+                # Mouse is inside this button, so it can't be in the others;
+                # clear any stale hover and stop dispatching.
+                for other in self._buttons:
+                    if other is not btn:
+                        other.hovered = False
+                break
 
     def update(self, dt: float) -> None:
         pass
 
     def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.title, self.title.get_rect(center=(640, 180)))
-        self.btn_play.draw(surface)
-        self.btn_quit.draw(surface)
\ No newline at end of file
+        # All static pixels land in one cached surface so a frame is a
+        # single blit; only a hovered button is re-drawn on top.
+        if self._static is None or self._static.get_size() != surface.get_size():
+            static = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            static.blit(self.title, self.title.get_rect(center=(640, 180)))
+            for btn in (self.btn_play, self.btn_quit):
+                hovered = btn.hovered
+                btn.hovered = False
+                btn.draw(static)
+                btn.hovered = hovered
+            self._static = static.convert_alpha()
+
+        surface.blit(self._static, (0, 0))
+        for btn in (self.btn_play, self.btn_quit):
+            if btn.hovered:
+                btn.draw(surface)
\ No newline at end of file
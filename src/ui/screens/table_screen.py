@@ -1,11 +1,177 @@
 from __future__ import annotations
+from functools import lru_cache
+from types import SimpleNamespace
+
 import pygame
 
 from src.ui.screens.base_screen import Screen
-from src.ui.widgets import Button, Slider, draw_rounded_rect, draw_text, draw_text_center, draw_card
+from src.ui.widgets import Button, Slider, draw_rounded_rect, draw_text, draw_text_center, render_card
+from src.poker.card import CARD_CODES, code_short_name
 from src.poker.table import PokerTable
 from src.poker.rules import Action
 
+@lru_cache(maxsize=32)
+def _ellipsis_width(font: pygame.font.Font) -> int:
+    return font.size("...")[0]
+
+@lru_cache(maxsize=32)
+def _chrome(
+    w: int,
+    h: int,
+    fill: tuple[int, int, int],
+    border: tuple[int, int, int],
+    radius: int,
+    border_w: int = 2,
+) -> pygame.Surface:
+    # Shared "filled rounded rect + border" template. These are redrawn at
+    # identical sizes every frame (seat panels, card backs, debug box), and
+    # the anti-aliased rounded fill is the expensive part — a blit of the
+    # cached template is a straight copy. Sizes only change on resize.
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    rect = surf.get_rect()
+    draw_rounded_rect(surf, rect, fill, radius=radius)
+    pygame.draw.rect(surf, border, rect, width=border_w, border_radius=radius)
+    return surf.convert_alpha()
+
+def _card_back(w: int, h: int, radius: int) -> pygame.Surface:
+    return _chrome(w, h, (15, 30, 55), (230, 230, 230), radius)
+
+@lru_cache(maxsize=8)
+def _back_strip(count: int, w: int, h: int, gap: int, radius: int) -> pygame.Surface:
+    # A whole row of card backs as one surface: the community/hole rows
+    # blit this once and overdraw only the dealt faces.
+    strip = pygame.Surface((count * w + (count - 1) * gap, h), pygame.SRCALPHA)
+    back = _card_back(w, h, radius)
+    strip.fblits([(back, (i * (w + gap), 0)) for i in range(count)])
+    return strip.convert_alpha()
+
+@lru_cache(maxsize=8)
+def _layout(w: int, h: int, n: int, line_h: int) -> SimpleNamespace:
+    # Every geometric quantity draw() needs is a pure function of the
+    # window size (plus seat count and line height), so the whole layout
+    # is computed once per size and reused. The contained Rects are shared
+    # across frames — callers must treat them as read-only.
+    pad = int(min(w, h) * 0.02)           # 2% padding
+    sidebar_w = int(w * 0.14)             # 14% left column
+    topbar_h = int(h * 0.08)              # 8% height
+
+    content_x = pad + sidebar_w + pad
+    content_w = w - content_x - pad
+
+    top_bar = pygame.Rect(content_x, pad, content_w, topbar_h)
+    table_rect = pygame.Rect(
+        content_x,
+        top_bar.bottom + pad,
+        content_w,
+        h - (top_bar.bottom + pad) - pad,
+    )
+
+    # Cards scale with table area
+    card_w = int(min(table_rect.w * 0.08, table_rect.h * 0.16))
+    card_h = int(card_w * 1.4)
+    gap = int(card_w * 0.18)
+    step = card_w + gap
+
+    # Player topbar row (You, AI-1..AI-4)
+    playerbar_h = max(int(table_rect.h * 0.18), line_h * 4)
+    playerbar = pygame.Rect(table_rect.x + pad, table_rect.y + pad,
+                            table_rect.w - (pad * 2), playerbar_h)
+
+    # Seat-box geometry (shared with the showdown overlay)
+    gap_bar = max(8, int(playerbar.w * 0.012))
+    box_w = (playerbar.w - (gap_bar * (n - 1))) // n
+
+    # Community row starts below the player bar; showdown shifts it down
+    # dynamically (see draw), so only the base y lives here.
+    community_y0 = playerbar.bottom + pad
+
+    hint_y = table_rect.bottom - pad - (line_h // 2)
+    hole_y = hint_y - pad - card_h
+
+    start_x = table_rect.centerx - ((card_w * 5) + (gap * 4)) // 2
+    hole_start_x = table_rect.centerx - ((card_w * 2) + gap) // 2
+
+    header_y = top_bar.y + int(topbar_h * 0.22)
+    debug_rect = pygame.Rect(content_x, top_bar.bottom + pad, content_w, int(h * 0.10))
+
+    return SimpleNamespace(
+        pad=pad, content_w=content_w, top_bar=top_bar, table_rect=table_rect,
+        card_w=card_w, card_h=card_h, gap=gap, step=step,
+        playerbar=playerbar, gap_bar=gap_bar, box_w=box_w, box_h=playerbar_h,
+        community_y0=community_y0, hint_y=hint_y, hole_y=hole_y,
+        start_x=start_x, hole_start_x=hole_start_x,
+        header_y=header_y, debug_rect=debug_rect,
+    )
+
+@lru_cache(maxsize=32)
+def _header_strs(hand_number: int, sb: int, bb: int, pot: int) -> tuple[str, str, str]:
+    # Header values repeat for many consecutive frames; memoising skips
+    # re-formatting and hands the text-render cache identical objects.
+    return (f"Hand {hand_number}", f"Blinds {sb}/{bb}", f"Pot {pot}")
+
+@lru_cache(maxsize=64)
+def _seat_label(seat: int, name: str, is_sb: bool, is_bb: bool, folded: bool) -> str:
+    label = f"[{seat}] {name}"
+    if is_sb:
+        label += " [SB]"
+    if is_bb:
+        label += " [BB]"
+    if folded:
+        label += " (Fold)"
+    return label
+
+@lru_cache(maxsize=128)
+def _chips_line(chips: int) -> str:
+    return f"Chips: {chips}"
+
+@lru_cache(maxsize=1024)
+def _truncate_to_width(text: str, font: pygame.font.Font, max_w: int) -> str:
+    # The same labels (names, chip counts, hand descriptions) are re-fit
+    # every frame; memoising skips the binary search and its font.size()
+    # calls on repeat frames. Fonts are hashable, so they key directly.
+    text = (text or "").strip()
+    if max_w <= 0 or not text:
+        return ""
+
+    full_w = font.size(text)[0]
+    if full_w <= max_w:
+        return text
+
+    ell = "..."
+    # leave room for ellipsis
+    max_w2 = max(0, max_w - _ellipsis_width(font))
+    if max_w2 <= 0:
+        return ell
+
+    size = font.size
+
+    def fits(k: int) -> bool:
+        return size(text[:k])[0] <= max_w2
+
+    # Text width is near-linear in length, so a proportional estimate lands
+    # within a few characters of the cut; bracketing around it and then
+    # bisecting the small window needs far fewer font.size() probes than
+    # bisecting the whole string.
+    n = len(text)
+    est = max(1, min(n - 1, (n * max_w2) // max(1, full_w)))
+    if fits(est):
+        lo, hi = est, min(n, est + 8)
+        while fits(hi):  # fits(n) is impossible: full_w > max_w > max_w2
+            lo, hi = hi, min(n, hi + 8)
+    else:
+        lo, hi = max(0, est - 8), est
+        while lo > 0 and not fits(lo):
+            lo, hi = max(0, lo - 8), lo
+
+    # Invariant: fits(lo) and not fits(hi); find the largest fitting cut.
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if fits(mid):
+            lo = mid
+        else:
+            hi = mid
+    return text[:lo] + ell
+
 class TableScreen(Screen):
     def __init__(self, ui, table: PokerTable, on_back):
         super().__init__()
@@ -14,6 +180,39 @@ class TableScreen(Screen):
         self.table = table
 
         self.show_debug = False
+        self._last_drawn_state: tuple | None = None
+        # Human's outstanding call amount, refreshed once per tick in
+        # update() and reused by the raise/all-in handlers.
+        self._to_call_0 = 0
+
+        # Line height comes precomputed from the UIManager (shared across
+        # screens); kept as an attribute for the hot paths here.
+        self._line_h = self.ui.font_small_h
+
+        # Static backdrop (top bar, felt, "Community" label) depends only on
+        # the window size; rendered once per resize and blitted whole.
+        self._bg_cache: pygame.Surface | None = None
+        self._cached_size: tuple[int, int] = (0, 0)
+
+        # The showdown overlay is frozen until the next hand starts, so it
+        # is rendered once per (hand, summary, window size) and blitted.
+        self._showdown_surf: pygame.Surface | None = None
+        self._showdown_cache_key: tuple | None = None
+
+        # Sidebar composite (buttons + slider + bet label), rebuilt only
+        # when a widget's visual state changes.
+        self._sidebar_cache: pygame.Surface | None = None
+        self._sidebar_state: tuple | None = None
+
+        # Whole composed frame, kept while the table is idle: repaints
+        # triggered by irrelevant events (mouse moving over the felt)
+        # become a single blit instead of a full compose.
+        self._frame_cache: pygame.Surface | None = None
+        self._frame_sig: tuple | None = None
+
+        # (state tuple, debug_string()) pair; the string is only rebuilt
+        # when the table state moves on.
+        self._debug_str_cache: tuple | None = None
 
         self.btn_back = Button(
             pygame.Rect(24, 20, 140, 44),
@@ -29,18 +228,22 @@ class TableScreen(Screen):
             on_click=self.table.start_new_hand,
         )
         
+        # Single callables shared by the buttons and the hotkey table.
+        self._do_fold = lambda: self.table.human_action(Action.FOLD)
+        self._do_check = lambda: self.table.human_action(Action.CHECK)
+
         self.btn_fold = Button(
             pygame.Rect(24, 128, 140, 44),
             "Fold",
             self.ui.font_small,
-            on_click=lambda: self.table.human_action(Action.FOLD),
+            on_click=self._do_fold,
         )
 
         self.btn_check = Button(
             pygame.Rect(24, 182, 140, 44),
             "Check",
             self.ui.font_small,
-            on_click=lambda: self.table.human_action(Action.CHECK),
+            on_click=self._do_check,
         )
 
         # Raise slider (percentage of your stack used as your "put in" amount)
@@ -60,26 +263,78 @@ class TableScreen(Screen):
             on_click=self._on_all_in,
         )
 
+        self._key_actions = {
+            pygame.K_d: self._toggle_debug,
+            pygame.K_n: self.table.start_new_hand,
+            pygame.K_f: self._do_fold,
+            pygame.K_c: self._do_check,
+            pygame.K_r: self._on_raise,
+        }
+
+        self._widgets = [
+            self.btn_back,
+            self.btn_deal,
+            self.btn_fold,
+            self.btn_check,
+            self.btn_raise,
+            self.raise_slider,
+            self.btn_all_in,
+        ]
+
+        # Sidebar bounding box (widgets + slider label) for dirty-rect
+        # updates: when only widget state changed, just this region is
+        # pushed to the display.
+        self._last_widget_state: tuple | None = None
+        self._any_hovered = False
+        self._widgets_rect = self.btn_back.rect.unionall([
+            self.btn_deal.rect,
+            self.btn_fold.rect,
+            self.btn_check.rect,
+            self.btn_raise.rect,
+            self.raise_slider.rect,
+            self.btn_all_in.rect,
+        ]).inflate(24, self._line_h * 2 + 16)
+
+    @property
+    def is_animating(self) -> bool:
+        # AI turns advance on timers, so keep polling while a hand runs.
+        return self.table.hand_active
+
     def handle_event(self, event: pygame.event.Event) -> None:
-        self.btn_back.handle_event(event)
-        self.btn_deal.handle_event(event)
-        self.btn_fold.handle_event(event)
-        self.btn_check.handle_event(event)
-        self.btn_raise.handle_event(event)
-        self.raise_slider.handle_event(event)
-        self.btn_all_in.handle_event(event)
+        # Hotkeys never concern the widgets, and widgets only care about
+        # mouse events — everything else bails before the dispatch loop.
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_d:
-                self.show_debug = not self.show_debug
-            elif event.key == pygame.K_n:
-                self.table.start_new_hand()
-            elif event.key == pygame.K_f:
-                self.table.human_action(Action.FOLD)
-            elif event.key == pygame.K_c:
-                self.table.human_action(Action.CHECK)
-            elif event.key == pygame.K_r:
-                self._on_raise()
+            action = self._key_actions.get(event.key)
+            if action is not None:
+                action()
+            return
+
+        if event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            return
+
+        # All widgets live in the sidebar: mouse events over the felt can
+        # skip the hit-test loop entirely. A dragging slider still needs
+        # motion/release events wherever the cursor is, and a motion event
+        # leaving the sidebar must clear hover state once.
+        if (event.pos[0] > self._widgets_rect.right
+                and not self.raise_slider.dragging
+                and not self._any_hovered):
+            return
+
+        hovered = False
+        for widget in self._widgets:
+            if widget.handle_event(event):
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    # Widget rects are disjoint, so a consumed click can't
+                    # concern anyone further down the list.
+                    break
+                hovered = True
+        if event.type == pygame.MOUSEMOTION:
+            self._any_hovered = hovered
                 
+    def _toggle_debug(self) -> None:
+        self.show_debug = not self.show_debug
+
     def round_to_nearest_ten(self, number: int) -> int:
         number = int(number)
         return (number // 10) * 10
@@ -88,8 +343,8 @@ class TableScreen(Screen):
                 
     def _on_raise(self) -> None:
         you = self.table.players[0]
-        prev_bet = self.table.current_bets.get(0, 0)
-        to_call = self.table.to_call(0)
+        prev_bet = self.table.current_bets[0]
+        to_call = self._to_call_0
 
         raw_put_in = int(you.chips * self.raise_slider.value)
         put_in = self.round_to_nearest_ten(raw_put_in)
@@ -113,8 +368,7 @@ class TableScreen(Screen):
         
     def _on_all_in(self) -> None:
         you = self.table.players[0]
-        prev_bet = self.table.current_bets.get(0, 0)
-        to_call = self.table.to_call(0)
+        prev_bet = self.table.current_bets[0]
 
         # All-in means "put in everything you can"
         target_total = prev_bet + you.chips
@@ -127,13 +381,37 @@ class TableScreen(Screen):
         self.table.human_action(Action.RAISE, raise_to_total=target_total)
 
     def update(self, dt: float) -> None:
-        self.table.update(dt)
+        table = self.table
+        table.update(dt)
+
+        # Snapshot the table once per tick; everything below reads from
+        # these locals rather than re-walking attribute chains.
+        hand_active = table.hand_active
+
+        # Repaint when the table's visible state moved on (AI acted, street
+        # dealt, hand ended, ...). "Thinking" is tracked as a bool so waiting
+        # on an AI timer doesn't force 60 repaints a second.
+        state = (
+            hand_active,
+            table.to_act_index,
+            table.street,
+            table.pot,
+            table.current_bet_amount,
+            table.last_action,
+            table._ai_deadline is not None,
+            len(table.community),
+            len(table.players[0].hand),
+        )
+        table_changed = state != self._last_drawn_state
+        if table_changed:
+            self._last_drawn_state = state
+            self.needs_redraw = True
 
         # Disable "New Hand" mid-hand
-        self.btn_deal.enabled = not self.table.hand_active
+        self.btn_deal.enabled = not hand_active
 
         # Only allow action buttons on the human's turn
-        human_turn = self.table.human_can_act()
+        human_turn = table.human_can_act()
         self.btn_fold.enabled = human_turn
         self.btn_check.enabled = human_turn
         self.btn_raise.enabled = human_turn
@@ -141,174 +419,210 @@ class TableScreen(Screen):
         self.btn_all_in.enabled = human_turn
 
         # Dynamic label: Check vs Call X
-        if self.table.hand_active:
-            to_call = self.table.to_call(0)
+        if hand_active:
+            self._to_call_0 = to_call = table.to_call(0)
             self.btn_check.text = f"Call {to_call}" if to_call > 0 else "Check"
         else:
+            self._to_call_0 = 0
             self.btn_check.text = "Check"
 
-    def draw(self, surface: pygame.Surface) -> None:
-        w, h = surface.get_size()
-
-        # --- Responsive layout constants ---
-        pad = int(min(w, h) * 0.02)           # 2% padding
-        sidebar_w = int(w * 0.14)             # 14% left column
-        topbar_h = int(h * 0.08)              # 8% height
-
-        # Left controls area
-        # (optional: you can also reposition buttons using these values later)
-        self.btn_back.draw(surface)
-        self.btn_deal.draw(surface)
-        self.btn_fold.draw(surface)
-        self.btn_check.draw(surface)
-        self.btn_raise.draw(surface)
-        self.btn_all_in.draw(surface)
-        self.raise_slider.draw(surface)
-
-        # Slider label: "Bet N" where N is % of your current chips
-        you = self.table.players[0]
-        bet_amt = self.round_to_nearest_ten(int(you.chips * self.raise_slider.value))
-        label_y = self.raise_slider.rect.y - self.ui.font_small.get_height() - 4
-        draw_text(surface, f"Bet {bet_amt}", self.ui.font_small, (245, 245, 245), (24, label_y))
-
-        # Content area (everything right of the sidebar)
-        content_x = pad + sidebar_w + pad
-        content_w = w - content_x - pad
-
-        top_bar = pygame.Rect(content_x, pad, content_w, topbar_h)
-        
-        showdown_active = (not self.table.hand_active) and bool(self.table.showdown_summary)
-
-        table_rect = pygame.Rect(
-            content_x,
-            top_bar.bottom + pad,
-            content_w,
-            h - (top_bar.bottom + pad) - pad,
+        # When the table itself is unchanged and only sidebar widgets moved
+        # (hover, slider drag, label swap), limit the display push to the
+        # sidebar region instead of flipping the whole frame.
+        widget_state = (
+            self.btn_back.hovered,
+            self.btn_deal.hovered,
+            self.btn_fold.hovered,
+            self.btn_check.hovered,
+            self.btn_raise.hovered,
+            self.btn_all_in.hovered,
+            self.raise_slider.value,
+            self.btn_check.text,
+            self.btn_deal.enabled,
+            human_turn,
         )
+        if widget_state != self._last_widget_state:
+            first_frame = self._last_widget_state is None
+            self._last_widget_state = widget_state
+            self.needs_redraw = True
+            if not table_changed and not first_frame:
+                self.dirty_rects.append(self._widgets_rect)
+        if table_changed:
+            self.dirty_rects.clear()
 
-        # Cards scale with table area
-        # Cards scale with table area
-        card_w = int(min(table_rect.w * 0.08, table_rect.h * 0.16))
-        card_h = int(card_w * 1.4)
-        gap = int(card_w * 0.18)
-
-        # Player panel scales with card size (instead of fixed 220x52)
-        panel_w = int(card_w * 2.6)
-        panel_h = int(card_h * 0.45)
+    def draw(self, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
 
-        # --- Player topbar row (You, AI-1..AI-4) ---
-        playerbar_h = max(int(table_rect.h * 0.18), self.ui.font_small.get_height() * 4)
-        playerbar = pygame.Rect(table_rect.x + pad, table_rect.y + pad, table_rect.w - (pad * 2), playerbar_h)
+        # Identical frame requested again (state and widgets unchanged):
+        # replay the cached compose.
+        sig = (self._last_drawn_state, self._last_widget_state, (w, h), self.show_debug)
+        if sig == self._frame_sig and self._frame_cache is not None:
+            surface.blit(self._frame_cache, (0, 0))
+            return
 
-        # Community row starts below the player bar
-                # Mini hole cards sit directly under each player box during showdown.
-        # So: reserve vertical space and push the community cards DOWN.
-        community_y = playerbar.bottom + pad
+        # Hot-path locals: draw touches these repeatedly and LOAD_FAST is
+        # cheaper than chained attribute lookups.
+        table = self.table
+        players = table.players
+        n = len(players)
+        font_small = self.ui.font_small
+        font_medium = self.ui.font_medium
+        line_h = self._line_h
+
+        # --- Responsive layout (pure function of window size, memoised) ---
+        L = _layout(w, h, n, line_h)
+        pad = L.pad
+        top_bar = L.top_bar
+        table_rect = L.table_rect
+        card_w, card_h, gap, step = L.card_w, L.card_h, L.gap, L.step
+        playerbar = L.playerbar
+        gap_bar, box_w, box_h = L.gap_bar, L.box_w, L.box_h
+        hint_y, hole_y = L.hint_y, L.hole_y
+
+        # Left controls area: the whole sidebar (buttons, slider, bet
+        # label) is composited once per visual state and blitted; button
+        # chrome only changes on hover/enable/label transitions.
+        you = players[0]
+        bet_amt = self.round_to_nearest_ten(int(you.chips * self.raise_slider.value))
+        sidebar_state = tuple(
+            (wdg.enabled, getattr(wdg, "hovered", False), getattr(wdg, "text", None))
+            for wdg in self._widgets
+        ) + (self.raise_slider.value, bet_amt)
+        if sidebar_state != self._sidebar_state:
+            self._sidebar_state = sidebar_state
+            ox, oy = self._widgets_rect.topleft
+            panel = pygame.Surface(self._widgets_rect.size, pygame.SRCALPHA)
+            for widget in self._widgets:
+                # Widgets draw at their own rects; shift into panel space
+                # for the compose, then restore for hit testing.
+                widget.rect.move_ip(-ox, -oy)
+                widget.draw(panel)
+                widget.rect.move_ip(ox, oy)
+            label_y = self.raise_slider.rect.y - line_h - 4
+            draw_text(panel, f"Bet {bet_amt}", font_small, (245, 245, 245), (24 - ox, label_y - oy))
+            self._sidebar_cache = panel.convert_alpha()
+        surface.blit(self._sidebar_cache, self._widgets_rect.topleft)
+
+        showdown_active = (not table.hand_active) and bool(table.showdown_summary)
+
+        # Community row starts below the player bar. Mini hole cards sit
+        # directly under each player box during showdown, so reserve
+        # vertical space and push the community cards DOWN.
+        community_y = L.community_y0
 
         if showdown_active:
-            n = len(self.table.players)
-            gap_bar = max(8, int(playerbar.w * 0.012))
-            box_w = (playerbar.w - (gap_bar * (n - 1))) // n
-
             mini_w, mini_h, _mini_gap = self._showdown_mini_sizes(card_w, gap, box_w, pad)
-            label_h = self.ui.font_small.get_height()
 
             # Space for: mini cards + label + padding
-            community_y += mini_h + label_h + pad
-
-        hint_y = table_rect.bottom - pad - (self.ui.font_small.get_height() // 2)
-        hole_y = hint_y - pad - card_h
-
-        y_top = community_y - pad - (panel_h // 2)
-        y_bottom = hole_y - pad - (panel_h // 2)
-
-        # --- Top bar ---
-        draw_rounded_rect(surface, top_bar, (10, 40, 26), radius=16)
-        pygame.draw.rect(surface, (28, 80, 54), top_bar, width=2, border_radius=16)
-
-        sb, bb = self.table.blinds.current_blinds()
-        header_left = f"Hand {self.table.hand_number}"
-        header_mid = f"Blinds {sb}/{bb}"
-        header_right = f"Pot {self.table.pot}"
-
-        draw_text(surface, header_left, self.ui.font_medium, (240, 240, 240),
-                (top_bar.x + pad, top_bar.y + int(topbar_h * 0.22)))
-        draw_text_center(surface, header_mid, self.ui.font_medium, (240, 240, 240),
+            community_y += mini_h + line_h + pad
+
+        # --- Static backdrop (top bar + felt), cached per window size ---
+        if (w, h) != self._cached_size:
+            first_size = self._cached_size == (0, 0)
+            self._cached_size = (w, h)
+            # New card sizes: scale suit icons and face art for both the
+            # main cards and the showdown minis now, rather than stalling
+            # on the first card rendered at each size.
+            pw_mini_w, pw_mini_h, _ = self._showdown_mini_sizes(card_w, gap, box_w, pad)
+            self.ui.prewarm_card_sizes(((card_w, card_h), (pw_mini_w, pw_mini_h)))
+            if first_size:
+                # Render the whole deck once at the starting size so every
+                # deal is a cache hit. Only on the first size seen — doing
+                # this per intermediate size during a resize drag would
+                # stall the drag for no benefit.
+                for code in CARD_CODES:
+                    render_card(code_short_name(code), card_w, card_h, self.ui)
+            bg = pygame.Surface((w, h), pygame.SRCALPHA)
+            draw_rounded_rect(bg, top_bar, (10, 40, 26), radius=16)
+            pygame.draw.rect(bg, (28, 80, 54), top_bar, width=2, border_radius=16)
+            draw_rounded_rect(bg, table_rect, (14, 58, 38), radius=24)
+            pygame.draw.rect(bg, (30, 92, 62), table_rect, width=2, border_radius=24)
+            draw_text_center(bg, "Community", font_small, (230, 230, 230),
+                            (table_rect.centerx, table_rect.y + int(table_rect.h * 0.08)))
+            self._bg_cache = bg.convert_alpha()
+        surface.blit(self._bg_cache, (0, 0))
+
+        sb, bb = table.blinds.current_blinds()
+        header_left, header_mid, header_right = _header_strs(table.hand_number, sb, bb, table.pot)
+
+        draw_text(surface, header_left, font_medium, (240, 240, 240),
+                (top_bar.x + pad, L.header_y))
+        draw_text_center(surface, header_mid, font_medium, (240, 240, 240),
                         (top_bar.centerx, top_bar.centery))
-        draw_text(surface, header_right, self.ui.font_medium, (240, 240, 240),
-                (top_bar.right - int(content_w * 0.16), top_bar.y + int(topbar_h * 0.22)))
-
-        # --- Table background ---
-        draw_rounded_rect(surface, table_rect, (14, 58, 38), radius=24)
-        pygame.draw.rect(surface, (30, 92, 62), table_rect, width=2, border_radius=24)
-
-        draw_text_center(surface, "Community", self.ui.font_small, (230, 230, 230),
-                        (table_rect.centerx, table_rect.y + int(table_rect.h * 0.08)))
+        draw_text(surface, header_right, font_medium, (240, 240, 240),
+                (top_bar.right - int(L.content_w * 0.16), L.header_y))
 
         # --- Community cards ---
-        community = self.table.community
-        total_w = (card_w * 5) + (gap * 4)
-        start_x = table_rect.centerx - total_w // 2
-
-        for i in range(5):
-            rect = pygame.Rect(start_x + i * (card_w + gap), community_y, card_w, card_h)
-
-            if i < len(community):
-                draw_card(surface, rect, community[i].short_name(), self.ui)
-            else:
-                # card back / placeholder
-                draw_rounded_rect(surface, rect, (15, 30, 55), radius=12)
-                pygame.draw.rect(surface, (230, 230, 230), rect, width=2, border_radius=12)
+        community = table.community
+        start_x = L.start_x
+
+        # One pre-rendered strip of five backs, then the dealt faces
+        # overdraw their slots in a single fblits batch.
+        surface.blit(_back_strip(5, card_w, card_h, gap, 12), (start_x, community_y))
+        surface.fblits([
+            (render_card(code_short_name(code), card_w, card_h, self.ui),
+             (start_x + i * step, community_y))
+            for i, code in enumerate(community)
+        ])
 
         # --- Player topbar (uniform row) ---
-        n = len(self.table.players)
-        gap_bar = max(8, int(playerbar.w * 0.012))
-        box_w = (playerbar.w - (gap_bar * (n - 1))) // n
-        box_h = playerbar.h
-
-        x = playerbar.x
+        # One template Rect moved per seat: Rect.move skips the constructor's
+        # argument validation on every iteration.
+        seat_box = pygame.Rect(playerbar.x, playerbar.y, box_w, box_h)
         for seat_idx in range(n):
-            p = self.table.players[seat_idx]
+            p = players[seat_idx]
             status = self._seat_status_text(seat_idx)
 
-            r = pygame.Rect(x, playerbar.y, box_w, box_h)
+            r = seat_box.move(seat_idx * (box_w + gap_bar), 0)
             self._draw_player_panel_rect(surface, r, seat_idx, p.name, p.chips, p.folded, status)
 
-            x += box_w + gap_bar
-            
-        showdown_active = (not self.table.hand_active) and bool(self.table.showdown_summary)
-        
         if not showdown_active:
             # --- Hole cards (seat 0) ---
-            you = self.table.players[0]
             hole = you.hand
-            
-            # --- Hole cards (seat 0) ---
-            hole_total_w = (card_w * 2) + gap
-            hole_start_x = table_rect.centerx - hole_total_w // 2
-
-            for i in range(2):
-                rect = pygame.Rect(hole_start_x + i * (card_w + gap), hole_y, card_w, card_h)
+            hole_start_x = L.hole_start_x
 
-                if i < len(hole):
-                    draw_card(surface, rect, hole[i].short_name(), self.ui)
-                else:
-                    draw_rounded_rect(surface, rect, (15, 30, 55), radius=12)
-                    pygame.draw.rect(surface, (230, 230, 230), rect, width=2, border_radius=12)
+            surface.blit(_back_strip(2, card_w, card_h, gap, 12), (hole_start_x, hole_y))
+            surface.fblits([
+                (render_card(code_short_name(code), card_w, card_h, self.ui),
+                 (hole_start_x + i * step, hole_y))
+                for i, code in enumerate(hole)
+            ])
 
-        draw_text_center(surface, "Press D to toggle debug", self.ui.font_small, (220, 220, 220),
+        draw_text_center(surface, "Press D to toggle debug", font_small, (220, 220, 220),
             (table_rect.centerx, hint_y))
-        
+
         # --- Showdown overlay ---
         if showdown_active:
-            self._draw_showdown_overlay(surface, table_rect, playerbar, pad, card_w, card_h, gap, community_y)
+            key = (table.hand_number, id(table.showdown_summary), w, h)
+            if key != self._showdown_cache_key:
+                self._showdown_cache_key = key
+                overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+                self._draw_showdown_overlay(overlay, table_rect, playerbar, pad, card_w, card_h,
+                                            gap, community_y, n, gap_bar, box_w)
+                self._showdown_surf = overlay.convert_alpha()
+            surface.blit(self._showdown_surf, (0, 0))
 
         if self.show_debug:
-            dbg = pygame.Rect(content_x, top_bar.bottom + pad, content_w, int(h * 0.10))
-            draw_rounded_rect(surface, dbg, (0, 0, 0), radius=16)
-            pygame.draw.rect(surface, (220, 220, 220), dbg, width=1, border_radius=16)
-            draw_text(surface, self.table.debug_string(), self.ui.font_small, (245, 245, 245),
+            dbg = L.debug_rect
+            surface.blit(_chrome(dbg.w, dbg.h, (0, 0, 0), (220, 220, 220), 16, border_w=1), dbg.topleft)
+            # debug_string() walks every player and formats a dozen fields;
+            # rebuild it only when the drawn state tuple actually moved on
+            # (update() allocates a fresh tuple exactly then, so identity
+            # works as the key).
+            cached = self._debug_str_cache
+            if cached is None or cached[0] is not self._last_drawn_state:
+                cached = (self._last_drawn_state, table.debug_string())
+                self._debug_str_cache = cached
+            draw_text(surface, cached[1], font_small, (245, 245, 245),
                     (dbg.x + pad, dbg.y + pad))
+
+        # Keep a copy of idle frames only — mid-hand frames are all distinct,
+        # so copying them would just add a full-screen memcpy per frame.
+        self._frame_sig = sig
+        if not table.hand_active:
+            self._frame_cache = surface.copy()
+        else:
+            self._frame_cache = None
             
     def _draw_showdown_overlay(
         self,
@@ -320,7 +634,11 @@ class TableScreen(Screen):
         card_h: int,
         gap: int,
         community_y: int,
+        n: int,
+        gap_bar: int,
+        box_w: int,
     ) -> None:
+        font_small = self.ui.font_small
         s = self.table.showdown_summary or {}
         rows = s.get("rows", [])
         winner = s.get("winner_name", "Unknown")
@@ -329,7 +647,7 @@ class TableScreen(Screen):
 
         # Compact result banner (not a giant modal)
         mw = int(table_rect.w * 0.72)
-        line_h = self.ui.font_small.get_height()
+        line_h = self._line_h
         mh = (pad * 2) + (line_h * 2)  # title + hint
 
         modal = pygame.Rect(0, 0, mw, mh)
@@ -343,34 +661,37 @@ class TableScreen(Screen):
         if modal.bottom > table_rect.bottom - pad:
             modal.bottom = table_rect.bottom - pad
 
-        draw_rounded_rect(surface, modal, (10, 40, 26), radius=20)
-        pygame.draw.rect(surface, (230, 230, 230), modal, width=2, border_radius=20)
+        surface.blit(_chrome(modal.w, modal.h, (10, 40, 26), (230, 230, 230), 20), modal.topleft)
 
         title = f"Result: {winner} wins ({winner_desc}) | Pot {pot}"
-        draw_text(surface, self._truncate_to_width(title, self.ui.font_small, modal.w - pad * 2),
-                  self.ui.font_small, (245, 245, 245), (modal.x + pad, modal.y + pad))
+        draw_text(surface, self._truncate_to_width(title, font_small, modal.w - pad * 2),
+                  font_small, (245, 245, 245), (modal.x + pad, modal.y + pad))
 
         # Draw each player's revealed hole cards UNDER their topbar box,
-        # with the evaluated hand text underneath the two cards.
-        n = len(self.table.players)
-        gap_bar = max(8, int(playerbar.w * 0.012))
-        box_w = (playerbar.w - (gap_bar * (n - 1))) // n
-        box_h = playerbar.h
+        # with the evaluated hand text underneath the two cards; the seat
+        # geometry (n, gap_bar, box_w) is computed once by draw().
 
         # Showdown reveal row: make cards bigger, but clamp so 2 cards always fit within the player box.
-        max_pair_w = box_w - (pad * 2)
-        mini_gap = max(6, int(gap * 0.60))
         mini_w, mini_h, mini_gap = self._showdown_mini_sizes(card_w, gap, box_w, pad)
 
         # Vertical placement: below playerbar, above community cards area
         cards_y = playerbar.bottom + max(6, int(pad * 0.6))
 
-        # Make a quick lookup: seat -> row dict
-        row_by_seat = {int(r.get("seat", 0)): r for r in rows}
+        # Make a quick lookup: seat -> row dict (seats are dense 0..n-1,
+        # so a list beats dict hashing)
+        row_by_seat: list[dict | None] = [None] * n
+        for row in rows:
+            seat = int(row.get("seat", 0))
+            if 0 <= seat < n:
+                row_by_seat[seat] = row
+
+        # All seats' mini cards are collected and pushed in one fblits batch.
+        blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        back = _card_back(mini_w, mini_h, 10)
 
         x = playerbar.x
         for seat_idx in range(n):
-            r = row_by_seat.get(seat_idx, {})
+            r = row_by_seat[seat_idx] or {}
             cards = r.get("cards", []) or []
             desc = (r.get("hand_name", "N/A") or "").strip()
 
@@ -380,28 +701,29 @@ class TableScreen(Screen):
             start_x = cx - (total_cards_w // 2)
 
             for i in range(2):
-                cr = pygame.Rect(start_x + i * (mini_w + mini_gap), cards_y, mini_w, mini_h)
+                pos = (start_x + i * (mini_w + mini_gap), cards_y)
                 if i < len(cards):
-                    draw_card(surface, cr, cards[i], self.ui)
+                    blit_seq.append((render_card(cards[i], mini_w, mini_h, self.ui), pos))
                 else:
-                    draw_rounded_rect(surface, cr, (15, 30, 55), radius=10)
-                    pygame.draw.rect(surface, (230, 230, 230), cr, width=2, border_radius=10)
+                    blit_seq.append((back, pos))
 
             # Evaluated hand text under the cards, bounded to the player's box width
             max_w = box_w - (pad * 2)
-            desc_fit = self._truncate_to_width(desc, self.ui.font_small, max_w)
+            desc_fit = self._truncate_to_width(desc, font_small, max_w)
             draw_text_center(
                 surface,
                 desc_fit,
-                self.ui.font_small,
+                font_small,
                 (245, 245, 245),
                 (cx, cards_y + mini_h + max(10, int(pad * 0.55))),
             )
 
             x += box_w + gap_bar
 
+        surface.fblits(blit_seq)
+
         hint = "Press New Hand to continue"
-        draw_text(surface, hint, self.ui.font_small, (245, 245, 245),
+        draw_text(surface, hint, font_small, (245, 245, 245),
                   (modal.x + pad, modal.y + pad + line_h))
         
     def _showdown_mini_sizes(self, card_w: int, gap: int, box_w: int, pad: int) -> tuple[int, int, int]:
@@ -414,28 +736,7 @@ class TableScreen(Screen):
         return mini_w, mini_h, mini_gap
 
     def _truncate_to_width(self, text: str, font: pygame.font.Font, max_w: int) -> str:
-        text = (text or "").strip()
-        if max_w <= 0 or not text:
-            return ""
-
-        if font.size(text)[0] <= max_w:
-            return text
-
-        ell = "..."
-        # leave room for ellipsis
-        max_w2 = max(0, max_w - font.size(ell)[0])
-        if max_w2 <= 0:
-            return ell
-
-        lo, hi = 0, len(text)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if font.size(text[:mid])[0] <= max_w2:
-                lo = mid + 1
-            else:
-                hi = mid
-        cut = max(0, lo - 1)
-        return text[:cut] + ell
+        return _truncate_to_width(text, font, max_w)
 
     def _draw_player_panel_rect(
         self,
@@ -447,27 +748,27 @@ class TableScreen(Screen):
         folded: bool,
         status: str,
     ) -> None:
-        draw_rounded_rect(surface, rect, (8, 34, 22), radius=16)
-        pygame.draw.rect(surface, (30, 92, 62), rect, width=2, border_radius=16)
-
-        label = f"[{seat}] {name}"
-
-        # Blind badges (current hand)
-        if self.table.hand_number > 0:
-            if seat == self.table.small_blind_index():
-                label += " [SB]"
-            if seat == self.table.big_blind_index:
-                label += " [BB]"
-
-        if folded:
-            label += " (Fold)"
+        surface.blit(_chrome(rect.w, rect.h, (8, 34, 22), (30, 92, 62), 16), rect.topleft)
+
+        table = self.table
+        font_small = self.ui.font_small
+
+        # Blind badges apply to the current hand only
+        in_hand = table.hand_number > 0
+        label = _seat_label(
+            seat,
+            name,
+            in_hand and seat == table.small_blind_index(),
+            in_hand and seat == table.big_blind_index,
+            folded,
+        )
 
         x_pad = max(10, int(rect.w * 0.05))
         y_pad = max(8, int(rect.h * 0.18))
-        line_h = self.ui.font_small.get_height()
+        line_h = self._line_h
         max_text_w = max(0, rect.w - (x_pad * 2))
 
-        lines = [label, f"Chips: {chips}"]
+        lines = [label, _chips_line(chips)]
         status = (status or "").strip()
         if status:
             lines.append(status)
@@ -478,59 +779,22 @@ class TableScreen(Screen):
 
         y = rect.y + y_pad
         for i, t in enumerate(lines):
-            t_fit = self._truncate_to_width(t, self.ui.font_small, max_text_w)
-            draw_text(surface, t_fit, self.ui.font_small, (240, 240, 240), (rect.x + x_pad, y + i * line_h))
+            t_fit = _truncate_to_width(t, font_small, max_text_w)
+            draw_text(surface, t_fit, font_small, (240, 240, 240), (rect.x + x_pad, y + i * line_h))
     
-    def _draw_player_panel(self, surface: pygame.Surface, seat: int, name: str, chips: int, folded: bool, status: str, cx: int, cy: int, panel_w: int, panel_h: int) -> None:
-        rect = pygame.Rect(cx - (panel_w // 2), cy - (panel_h // 2), panel_w, panel_h)
-        draw_rounded_rect(surface, rect, (8, 34, 22), radius=16)
-        pygame.draw.rect(surface, (30, 92, 62), rect, width=2, border_radius=16)
-
-        label = f"[{seat}] {name}"
-        if folded:
-            label += " (Fold)"
-        x_pad = max(10, int(panel_w * 0.05))
-        line_h = self.ui.font_small.get_height()
-
-        lines = [label, f"Chips: {chips}"]
-        status = (status or "").strip()
-        if status:
-            lines.append(status)
-
-        total_h = len(lines) * line_h
-        y = rect.y + max(6, (panel_h - total_h) // 2)
-
-        for i, text in enumerate(lines):
-            draw_text(surface, text, self.ui.font_small, (240, 240, 240), (rect.x + x_pad, y + i * line_h))
-        
     def _seat_status_text(self, seat: int) -> str:
+        table = self.table
         # Turn / thinking
-        if self.table.hand_active and self.table.to_act_index == seat:
+        if table.hand_active and table.to_act_index == seat:
             if seat == 0:
                 return "Your turn"
-            # CPU turn: show “Thinking…” while its timer is running (or until action fires)
-            if getattr(self.table, "_ai_timer", 0.0) > 0.0:
+            # CPU turn: show “Thinking…” while its deadline is pending (or until action fires)
+            if table._ai_deadline is not None:
                 return "Thinking..."
 
             # If timer not set yet, still show turn ownership
             return "CPU turn"
 
-        # Last action (per-seat)
-        return self.table.last_actions.get(seat, "")
-
-    def _seat_positions(self, table_rect: pygame.Rect, n: int, y_top: int, y_bottom: int) -> list[tuple[int, int]]:
-        cx = table_rect.centerx
-        left = table_rect.left
-        right = table_rect.right
-        top = table_rect.top
-        bottom = table_rect.bottom
-
-        # tuned for 5 players
-        # tuned for 5 players
-        return [
-            (cx, y_bottom),                                              # 0 You
-            (left + int(table_rect.w * 0.20), y_bottom),                  # 1
-            (left + int(table_rect.w * 0.28), y_top),                     # 2
-            (right - int(table_rect.w * 0.28), y_top),                    # 3
-            (right - int(table_rect.w * 0.20), y_bottom),                 # 4
-        ]
\ No newline at end of file
+        # Last action (per-seat), formatted only now that it's displayed
+        return table.seat_action_text(seat)
+
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import pygame
+from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
 
 class UIManager:
@@ -8,9 +10,6 @@ class UIManager:
     """
     def __init__(self) -> None:
         pygame.font.init()
-        self.font_large = pygame.font.SysFont("arial", 48)
-        self.font_medium = pygame.font.SysFont("arial", 28)
-        self.font_small = pygame.font.SysFont("arial", 20)
 
         self.colors = {
             "white": (245, 245, 245),
@@ -22,27 +21,52 @@ class UIManager:
         root = Path(__file__).resolve().parents[2]          # project root (…/src/ui/ui_manager.py -> …/)
         img_dir = root / "assets" / "images"
         
+        # One directory scan up front; lookups are case-insensitive, so
+        # "Jack.png" vs "jack.png" is one index probe instead of stacked
+        # load attempts that each raise and print.
+        try:
+            img_index = {p.name.lower(): p for p in img_dir.iterdir()
+                         if p.suffix.lower() == ".png"}
+        except OSError:
+            img_index = {}
+
         def _load_png(name: str):
+            path = img_index.get(name.lower())
+            if path is None:
+                print(f"[UI] Could not load {name}: no such file in {img_dir}")
+                return None
             try:
-                return pygame.image.load(str(img_dir / name)).convert_alpha()
+                return pygame.image.load(str(path)).convert_alpha()
             except Exception as e:
                 print(f"[UI] Could not load {name}: {e}")
                 return None
-            
+
         def _load_any(names: list[str]):
             for n in names:
-                img = _load_png(n)
-                if img is not None:
-                    return img
+                if n.lower() in img_index:
+                    return _load_png(n)
+            print(f"[UI] Could not load any of {names}")
             return None
 
+        # Suit art is stored premultiplied so card rendering can use the
+        # faster BLEND_PREMULTIPLIED blit path (scaling a premultiplied
+        # source also avoids fringe artifacts at the alpha edge).
         self._suit_base = {
             "C": _load_png("club.png"),
             "D": _load_png("diamond.png"),
             "H": _load_png("heart.png"),
             "S": _load_png("spade.png"),
         }
-        self._suit_scaled: dict[tuple[str, int], pygame.Surface] = {}
+        for k, s in self._suit_base.items():
+            if s is not None:
+                self._suit_base[k] = s.premul_alpha()
+        self.premul_suits = True
+        # LRU of scaled suit icons: px tracks the window size, so an
+        # unbounded dict would grow with every resize.
+        self._suit_scaled: OrderedDict[tuple[str, int], pygame.Surface] = OrderedDict()
+        # Composed corner labels (rank glyph + suit icon, plus the rotated
+        # twin for the bottom-right corner), keyed by rank/suit/font/sizes.
+        self._corner_cache: OrderedDict[tuple, tuple[pygame.Surface, pygame.Surface]] = OrderedDict()
         # Face art (optional; will fall back gracefully if missing)
         self._face_base = {
             "J": _load_any(["Jack.png", "jack.png"]),
@@ -53,8 +77,45 @@ class UIManager:
         for r, s in self._face_base.items():
             if s is not None:
                 self._face_trimmed[r] = self._trim_alpha(s, min_alpha=10, pad_ratio=0.03)
-        self._face_scaled: dict[tuple[str, int, int], pygame.Surface] = {}
+        # Premultiplied like the suit art, so scaled faces can join the
+        # BLEND_PREMULTIPLIED blit batch in draw_card.
+        for d in (self._face_base, self._face_trimmed):
+            for r, s in d.items():
+                if s is not None:
+                    d[r] = s.premul_alpha()
+        self.premul_faces = True
+        # Bounded like _suit_scaled: resize drags would otherwise retain a
+        # scaled copy of each face per intermediate size forever.
+        self._face_scaled: OrderedDict[tuple[str, int, int], pygame.Surface] = OrderedDict()
         
+    # Fonts are created on first access: SysFont scans system font metadata,
+    # so a font no screen ever touches costs nothing. The *_h line heights
+    # are fixed per font and cached the same way, so hot paths don't
+    # re-enter SDL_ttf for them.
+    @cached_property
+    def font_large(self) -> pygame.font.Font:
+        return pygame.font.SysFont("arial", 48)
+
+    @cached_property
+    def font_medium(self) -> pygame.font.Font:
+        return pygame.font.SysFont("arial", 28)
+
+    @cached_property
+    def font_small(self) -> pygame.font.Font:
+        return pygame.font.SysFont("arial", 20)
+
+    @cached_property
+    def font_large_h(self) -> int:
+        return self.font_large.get_height()
+
+    @cached_property
+    def font_medium_h(self) -> int:
+        return self.font_medium.get_height()
+
+    @cached_property
+    def font_small_h(self) -> int:
+        return self.font_small.get_height()
+
     @staticmethod
     def _trim_alpha(surf: pygame.Surface, *, min_alpha: int = 1, pad_ratio: float = 0.03) -> pygame.Surface:
         """
@@ -73,6 +134,11 @@ class UIManager:
         out.blit(surf, (0, 0), rect)
         return out
     
+    # A window size needs up to ~8 icon sizes per suit (corner, ace, pip
+    # tiers at two card scales); 64 entries covers the current and previous
+    # window size before eviction kicks in.
+    _SUIT_CACHE_MAX = 64
+
     def get_suit_icon(self, suit: str, px: int) -> pygame.Surface | None:
         if px <= 0:
             return None
@@ -80,12 +146,100 @@ class UIManager:
         if base is None:
             return None
 
+        # Quantize to a 4 px grid: continuous resizing otherwise produces a
+        # new size every frame and turns every lookup into a smoothscale.
+        px = (px + 3) & ~3
         key = (suit, px)
-        cached = self._suit_scaled.get(key)
+        cache = self._suit_scaled
+        cached = cache.get(key)
         if cached is None:
-            cached = pygame.transform.smoothscale(base, (px, px))
-            self._suit_scaled[key] = cached
+            bw = base.get_width()
+            if bw >= px and bw % px == 0:
+                # Exact integer downscale: nearest is ~3x faster and
+                # indistinguishable at icon sizes.
+                cached = pygame.transform.scale(base, (px, px))
+            else:
+                cached = pygame.transform.smoothscale(base, (px, px))
+            cache[key] = cached
+            if len(cache) > self._SUIT_CACHE_MAX:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
         return cached
+
+    def prewarm_suits(self, px: int) -> None:
+        """Scale all four suits at px ahead of first use (e.g. on resize)."""
+        for suit in self._suit_base:
+            self.get_suit_icon(suit, px)
+
+    def prewarm_card_sizes(self, sizes) -> None:
+        """Pre-scale every suit icon and face-art size that rendering a card
+        of the given (w, h) sizes will ask for, so the first deal at a new
+        window size doesn't stall on a burst of smoothscale calls.
+
+        The pixel formulas mirror the ones in widgets.draw_card (corner,
+        pip tiers, ace, face bounds) — keep them in sync."""
+        for (w, h) in sizes:
+            for px in {
+                max(12, int(w * 0.22)),   # corner icon
+                max(14, int(w * 0.24)),   # pips, counts <= 3
+                max(14, int(w * 0.21)),   # pips, counts <= 6
+                max(14, int(w * 0.18)),   # pips, counts <= 10
+                max(22, int(w * 0.62)),   # ace
+            }:
+                self.prewarm_suits(px)
+            pad = max(6, int(w * 0.08))
+            face_w = int((w - pad * 2) * 0.8)
+            face_h = int((h - pad * 2) * 0.8)
+            for rank in ("J", "Q", "K"):
+                self.get_face_art(rank, face_w, face_h)
+
+    # 52 rank/suit combos at a couple of live card sizes; same sizing
+    # rationale as the suit-icon LRU above.
+    _CORNER_CACHE_MAX = 128
+
+    def get_corner_label(
+        self,
+        rank: str,
+        suit: str,
+        font: pygame.font.Font,
+        icon_px: int,
+        gap: int,
+        color: tuple[int, int, int],
+    ) -> tuple[pygame.Surface, pygame.Surface]:
+        """Return the composed corner label (rank glyph + suit icon) and its
+        180°-rotated twin, both premultiplied. Composing allocates surfaces
+        and rotates, so results are cached per (rank, suit, font, sizes)."""
+        key = (rank, suit, font, icon_px, gap, color)
+        cache = self._corner_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+        rank_img = font.render(rank, True, color).premul_alpha()
+        icon = self.get_suit_icon(suit, icon_px)
+        if icon is None:
+            icon = font.render(suit, True, color).premul_alpha()
+
+        corner_w = rank_img.get_width() + gap + icon.get_width()
+        corner_h = max(rank_img.get_height(), icon.get_height())
+        corner = pygame.Surface((corner_w, corner_h), pygame.SRCALPHA)
+        premul = pygame.BLEND_PREMULTIPLIED
+        corner.blit(rank_img, (0, (corner_h - rank_img.get_height()) // 2), special_flags=premul)
+        corner.blit(icon, (rank_img.get_width() + gap, (corner_h - icon.get_height()) // 2), special_flags=premul)
+
+        # A 180° turn is a flip in both axes; flip skips the general
+        # rotation path and its bounding-box math.
+        cached = (corner, pygame.transform.flip(corner, True, True))
+        cache[key] = cached
+        if len(cache) > self._CORNER_CACHE_MAX:
+            cache.popitem(last=False)
+        return cached
+    # Three face ranks at two card scales plus headroom for the previous
+    # window size.
+    _FACE_CACHE_MAX = 16
+
     def get_face_art(self, rank: str, max_w: int, max_h: int) -> pygame.Surface | None:
         """Return a scaled face-card surface (J/Q/K) that fits inside max_w x max_h."""
         if max_w <= 0 or max_h <= 0:
@@ -99,13 +253,24 @@ class UIManager:
         if bw <= 0 or bh <= 0:
             return None
 
+        # Quantize the bounds down to a 4 px grid (down, so the art never
+        # exceeds them) — same cache-thrash guard as get_suit_icon. Doing it
+        # on the inputs keeps the aspect ratio exact and makes neighbouring
+        # bounds resolve to the same target size.
+        max_w = max(1, max_w & ~3)
+        max_h = max(1, max_h & ~3)
         scale = min(max_w / bw, max_h / bh)
         tw = max(1, int(bw * scale))
         th = max(1, int(bh * scale))
 
         key = (rank, tw, th)
-        cached = self._face_scaled.get(key)
+        cache = self._face_scaled
+        cached = cache.get(key)
         if cached is None:
             cached = pygame.transform.smoothscale(base, (tw, th))
-            self._face_scaled[key] = cached
+            cache[key] = cached
+            if len(cache) > self._FACE_CACHE_MAX:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
         return cached
\ No newline at end of file
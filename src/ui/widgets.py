@@ -1,26 +1,122 @@
 from __future__ import annotations
+from functools import lru_cache
+
 import pygame
 from typing import Callable
 
+from src.poker.card import RANKS, SUITS
+
 _FONT_CACHE: dict[int, pygame.font.Font] = {}
 
+def _pip_layout(n: int) -> list[tuple[float, float]]:
+    # Fractional pip positions within a card's pip area, classic deck style
+    l, c, r = 0.28, 0.50, 0.72
+    y1, y2, y3, y4, y5 = 0.08, 0.30, 0.50, 0.70, 0.92
+    yA, yB, yC, yD, yE, yF = 0.05, 0.23, 0.41, 0.59, 0.77, 0.95
+
+    if n == 2:
+        return [(c, y1), (c, y5)]
+    if n == 3:
+        return [(c, y1), (c, y3), (c, y5)]
+    if n == 4:
+        return [(l, y1), (r, y1), (l, y5), (r, y5)]
+    if n == 5:
+        return [(l, y1), (r, y1), (c, y3), (l, y5), (r, y5)]
+    if n == 6:
+        return [(l, y1), (r, y1), (l, y3), (r, y3), (l, y5), (r, y5)]
+    if n == 7:
+        return [(l, y1), (r, y1), (c, y2), (l, y3), (r, y3), (l, y5), (r, y5)]
+    if n == 8:
+        return [(l, y1), (r, y1), (c, y2), (l, y3), (r, y3), (c, y4), (l, y5), (r, y5)]
+    if n == 9:
+        return [(l, y1), (r, y1), (c, y2), (l, y3), (c, y3), (r, y3), (c, y4), (l, y5), (r, y5)]
+    if n == 10:
+        return [(l, yA), (r, yA), (l, yB), (r, yB), (c, yC), (c, yD), (l, yE), (r, yE), (l, yF), (r, yF)]
+    return []
+
+# Frozen at import so draw_card does a plain index instead of rebuilding
+# the coordinate lists per card.
+_PIP_LAYOUTS: tuple[tuple[tuple[float, float], ...], ...] = tuple(
+    tuple(_pip_layout(n)) for n in range(11)
+)
+
+# label -> (rank, suit, is_red, pip_count) for the 52-card domain, so
+# draw_card's parsing (slices, membership test, int() with try/except)
+# collapses to one dict lookup. Labels are spelled the way card.py
+# spells them (ten is "10", not "T").
+_CARD_META: dict[str, tuple[str, str, bool, int]] = {
+    f"{r}{s}": (r, s, s in ("H", "D"), int(r) if r.isdigit() else 0)
+    for r in RANKS
+    for s in SUITS
+}
+
+@lru_cache(maxsize=32)
+def _blank_card(w: int, h: int) -> pygame.Surface:
+    # White rounded face with its 2 px border, baked once per size so
+    # draw_card blits it instead of issuing two draw.rect calls.
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    rect = surf.get_rect()
+    draw_rounded_rect(surf, rect, (245, 245, 245), radius=12)
+    pygame.draw.rect(surf, (25, 25, 25), rect, width=2, border_radius=12)
+    return surf.convert_alpha()
+
+@lru_cache(maxsize=128)
+def _glyph(text: str, font: pygame.font.Font, color: tuple[int, int, int]) -> pygame.Surface:
+    # Fallback glyphs used in place of missing art: rendered once, trimmed
+    # of transparent margins (so centring tracks the visible ink, like
+    # UIManager does for face art) and premultiplied for the blit batch.
+    surf = font.render(text, True, color)
+    rect = surf.get_bounding_rect(min_alpha=10)
+    if 0 < rect.w < surf.get_width() or 0 < rect.h < surf.get_height():
+        out = pygame.Surface(rect.size, pygame.SRCALPHA)
+        out.blit(surf, (0, 0), rect)
+        surf = out
+    return surf.premul_alpha()
+
+@lru_cache(maxsize=512)
+def _render_text(text: str, font: pygame.font.Font, color: tuple[int, int, int]) -> pygame.Surface:
+    # font.render is one of the slowest pygame calls and most UI strings
+    # repeat frame after frame ("Community", "Chips: N", button labels...),
+    # so rendered surfaces are memoised. Fonts are hashable, rendering is
+    # pure, and blitting never mutates the source surface.
+    return font.render(text, True, color)
+
 def draw_rounded_rect(surface: pygame.Surface, rect: pygame.Rect, color: tuple[int, int, int], radius: int = 12) -> None:
     pygame.draw.rect(surface, color, rect, border_radius=radius)
 
 def draw_text(surface: pygame.Surface, text: str, font: pygame.font.Font, color: tuple[int, int, int], pos: tuple[int, int]) -> None:
-    img = font.render(text, True, color)
-    surface.blit(img, pos)
+    surface.blit(_render_text(text, font, color), pos)
 
 def draw_text_center(surface: pygame.Surface, text: str, font: pygame.font.Font, color: tuple[int, int, int], center: tuple[int, int]) -> None:
-    img = font.render(text, True, color)
-    r = img.get_rect(center=center)
-    surface.blit(img, r)
+    img = _render_text(text, font, color)
+    surface.blit(img, img.get_rect(center=center))
     
+# Resolved on first use (widgets is imported before pygame.font.init runs):
+# SysFont re-scans the system font manifest for every new size, while a
+# matched TTF path loads directly. False = not resolved yet.
+_BOLD_TTF_PATH: str | None | bool = False
+_BOLD_NEEDS_EMBOLDEN = False
+
 def _get_bold_font(px: int) -> pygame.font.Font:
+    global _BOLD_TTF_PATH, _BOLD_NEEDS_EMBOLDEN
     px = max(12, px)
     f = _FONT_CACHE.get(px)
     if f is None:
-        f = pygame.font.SysFont("arial", px, bold=True)
+        if _BOLD_TTF_PATH is False:
+            _BOLD_TTF_PATH = pygame.font.match_font("arial", bold=True)
+            # When no true bold face exists, match_font falls back to the
+            # regular file; only then does the faux-bold flag apply (like
+            # SysFont does). A real bold face needs no emboldening.
+            _BOLD_NEEDS_EMBOLDEN = (
+                _BOLD_TTF_PATH is not None
+                and _BOLD_TTF_PATH == pygame.font.match_font("arial")
+            )
+        if _BOLD_TTF_PATH:
+            f = pygame.font.Font(_BOLD_TTF_PATH, px)
+            if _BOLD_NEEDS_EMBOLDEN:
+                f.set_bold(True)
+        else:
+            f = pygame.font.SysFont("arial", px, bold=True)
         _FONT_CACHE[px] = f
     return f
 
@@ -39,15 +135,19 @@ class Button:
         self.hovered = False
         self.enabled = True
 
-    def handle_event(self, event: pygame.event.Event) -> None:
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Returns True when the event landed inside this button."""
         if not self.enabled:
-            return
+            return False
 
         if event.type == pygame.MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            return self.hovered
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.on_click()
+                return True
+        return False
 
     def draw(self, surface: pygame.Surface) -> None:
         # Enabled should look clickable; disabled should look greyed-out
@@ -105,49 +205,77 @@ class Slider:
         draw_rounded_rect(surface, knob, (245, 245, 245), radius=10)
         pygame.draw.rect(surface, (25, 25, 25), knob, width=2, border_radius=10)
 
+@lru_cache(maxsize=64)
+def render_card(label: str, w: int, h: int, ui=None) -> pygame.Surface:
+    """Render a full card face to its own surface (for blit batching).
+
+    Cached per (label, size): a card face is pure function of its label
+    and dimensions, so the corner text, pips and face art are rasterised
+    once and every later frame is a straight blit. Sizes only change on
+    window resize, which repopulates the cache naturally.
+    """
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    draw_card(surf, surf.get_rect(), label, ui)
+    return surf.convert_alpha()
+
 def draw_card(surface: pygame.Surface, rect: pygame.Rect, label: str, ui=None) -> None:
-    draw_rounded_rect(surface, rect, (245, 245, 245), radius=12)
-    pygame.draw.rect(surface, (25, 25, 25), rect, width=2, border_radius=12)
+    surface.blit(_blank_card(rect.w, rect.h), rect.topleft)
 
-    label = (label or "").strip()
-    if len(label) < 2:
+    meta = _CARD_META.get(label)
+    if meta is None:
+        label = (label or "").strip()
+        meta = _CARD_META.get(label)
+    if meta is None:
         return
-
-    rank, suit = label[:-1], label[-1]
-    is_red = suit in ("H", "D")
+    rank, suit, is_red, count = meta
     text_color = (180, 0, 0) if is_red else (25, 25, 25)
 
     font_px = max(14, int(rect.h * 0.18))
     font = _get_bold_font(font_px)
     pad = max(6, int(rect.w * 0.08))
 
-    # Corner label surface (top-left + bottom-right rotated)
+    # Everything composited onto the card goes through the premultiplied
+    # blit path (SIMD-optimised in pygame 2); UIManager stores suit art
+    # premultiplied and locally rendered glyphs are converted on the fly.
+    premul = pygame.BLEND_PREMULTIPLIED
+    suits_premul = getattr(ui, "premul_suits", False)
+    # Bind the ui hooks once; ui is either None or a UIManager, and these
+    # are re-checked several times below on the per-card path.
+    get_suit_icon = getattr(ui, "get_suit_icon", None)
+    get_face_art = getattr(ui, "get_face_art", None)
+    get_corner_label = getattr(ui, "get_corner_label", None)
+
+    # Corner label surface (top-left + bottom-right rotated). Composing
+    # one allocates surfaces, renders glyphs and rotates — the UIManager
+    # caches the pair per (rank, suit, sizes).
     gap = max(2, pad // 3)
-
-    rank_img = font.render(rank, True, text_color)
-
     corner_icon_px = max(12, int(rect.w * 0.22))  # <-- key change: size tied to card width
-    corner_icon = None
-    if ui is not None and hasattr(ui, "get_suit_icon"):
-        corner_icon = ui.get_suit_icon(suit, corner_icon_px)
 
-    if corner_icon is None:
-        corner_icon = font.render(suit, True, text_color)
+    if get_corner_label is not None:
+        corner, corner_rot = get_corner_label(rank, suit, font, corner_icon_px, gap, text_color)
+    else:
+        rank_img = _glyph(rank, font, text_color)
+        corner_icon = _glyph(suit, font, text_color)
+
+        corner_w = rank_img.get_width() + gap + corner_icon.get_width()
+        corner_h = max(rank_img.get_height(), corner_icon.get_height())
 
-    corner_w = rank_img.get_width() + gap + corner_icon.get_width()
-    corner_h = max(rank_img.get_height(), corner_icon.get_height())
+        corner = pygame.Surface((corner_w, corner_h), pygame.SRCALPHA)
+        corner.blit(rank_img, (0, (corner_h - rank_img.get_height()) // 2), special_flags=premul)
+        corner.blit(corner_icon, (rank_img.get_width() + gap, (corner_h - corner_icon.get_height()) // 2), special_flags=premul)
+        corner_rot = pygame.transform.flip(corner, True, True)  # 180° turn
 
-    corner = pygame.Surface((corner_w, corner_h), pygame.SRCALPHA)
-    corner.blit(rank_img, (0, (corner_h - rank_img.get_height()) // 2))
-    corner.blit(corner_icon, (rank_img.get_width() + gap, (corner_h - corner_icon.get_height()) // 2))
+    corner_w, corner_h = corner.get_size()
 
-    # Top-left
-    surface.blit(corner, (rect.x + pad, rect.y + pad))
+    # All premultiplied composites (corners, ace, pips) are collected and
+    # flushed through one fblits call, which skips the per-blit argument
+    # parsing and rect-return allocation of surface.blit.
+    blits: list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]] = [
+        # Top-left, and bottom-right rotated 180° like real cards
+        (corner, (rect.x + pad, rect.y + pad)),
+        (corner_rot, (rect.right - pad - corner_w, rect.bottom - pad - corner_h)),
+    ]
 
-    # Bottom-right (rotated 180°, like real cards)
-    corner_rot = pygame.transform.rotate(corner, 180)
-    surface.blit(corner_rot, (rect.right - pad - corner_w, rect.bottom - pad - corner_h))
-    
     # --- Center art / pips ---
     inner = rect.inflate(-pad * 2, -pad * 2)
     reserve = corner_h + max(2, pad // 2)
@@ -156,63 +284,35 @@ def draw_card(surface: pygame.Surface, rect: pygame.Rect, label: str, ui=None) -
     # Face cards: center art (King.png / Queen.png / Jack.png)
     if rank in ("J", "Q", "K"):
         face = None
-        if ui is not None and hasattr(ui, "get_face_art"):
-            face = ui.get_face_art(rank, int(inner.w * 0.8), int(inner.h * 0.8))
+        if get_face_art is not None:
+            face = get_face_art(rank, int(inner.w * 0.8), int(inner.h * 0.8))
         if face is not None:
-            surface.blit(face, face.get_rect(center=rect.center))
+            if not getattr(ui, "premul_faces", False):
+                face = face.premul_alpha()
         else:
             # Fallback if art is missing
             big_font = _get_bold_font(max(18, int(rect.h * 0.42)))
-            draw_text_center(surface, rank, big_font, text_color, rect.center)
+            face = _glyph(rank, big_font, text_color)
+        fw, fh = face.get_size()
+        blits.append((face, (rect.centerx - (fw >> 1), rect.centery - (fh >> 1))))
+        surface.fblits(blits, premul)
         return
 
     # Ace: single suit icon in the center
     if rank == "A":
         ace_px = max(22, int(rect.w * 0.62))
         ace = None
-        if ui is not None and hasattr(ui, "get_suit_icon"):
-            ace = ui.get_suit_icon(suit, ace_px)
+        if get_suit_icon is not None:
+            ace = get_suit_icon(suit, ace_px)
+            if ace is not None and not suits_premul:
+                ace = ace.premul_alpha()
         if ace is None:
-            ace = font.render(suit, True, text_color)
-        surface.blit(ace, ace.get_rect(center=rect.center))
+            ace = _glyph(suit, font, text_color)
+        aw, ah = ace.get_size()
+        blits.append((ace, (rect.centerx - (aw >> 1), rect.centery - (ah >> 1))))
+        surface.fblits(blits, premul)
         return
 
-    # Number cards (2-10): pip layouts
-    def _pip_layout(n: int) -> list[tuple[float, float]]:
-        l, c, r = 0.28, 0.50, 0.72
-        y1, y2, y3, y4, y5 = 0.08, 0.30, 0.50, 0.70, 0.92
-        yA, yB, yC, yD, yE, yF = 0.05, 0.23, 0.41, 0.59, 0.77, 0.95
-
-        if n == 2:
-            return [(c, y1), (c, y5)]
-        if n == 3:
-            return [(c, y1), (c, y3), (c, y5)]
-        if n == 4:
-            return [(l, y1), (r, y1), (l, y5), (r, y5)]
-        if n == 5:
-            return [(l, y1), (r, y1), (c, y3), (l, y5), (r, y5)]
-        if n == 6:
-            return [(l, y1), (r, y1), (l, y3), (r, y3), (l, y5), (r, y5)]
-        if n == 7:
-            return [(l, y1), (r, y1), (c, y2), (l, y3), (r, y3), (l, y5), (r, y5)]
-        if n == 8:
-            return [(l, y1), (r, y1), (c, y2), (l, y3), (r, y3), (c, y4), (l, y5), (r, y5)]
-        if n == 9:
-            return [(l, y1), (r, y1), (c, y2), (l, y3), (c, y3), (r, y3), (c, y4), (l, y5), (r, y5)]
-        if n == 10:
-            return [(l, yA), (r, yA), (l, yB), (r, yB), (c, yC), (c, yD), (l, yE), (r, yE), (l, yF), (r, yF)]
-        return []
-
-    # Convert rank to a pip count
-    count = 0
-    if rank == "T":
-        count = 10
-    else:
-        try:
-            count = int(rank)
-        except ValueError:
-            count = 0
-
     if 2 <= count <= 10:
         if count <= 3:
             pip_px = max(14, int(rect.w * 0.24))
@@ -222,12 +322,21 @@ def draw_card(surface: pygame.Surface, rect: pygame.Rect, label: str, ui=None) -
             pip_px = max(14, int(rect.w * 0.18))
 
         pip_img = None
-        if ui is not None and hasattr(ui, "get_suit_icon"):
-            pip_img = ui.get_suit_icon(suit, pip_px)
+        if get_suit_icon is not None:
+            pip_img = get_suit_icon(suit, pip_px)
+            if pip_img is not None and not suits_premul:
+                pip_img = pip_img.premul_alpha()
         if pip_img is None:
-            pip_img = font.render(suit, True, text_color)
-
-        for (xp, yp) in _pip_layout(count):
-            cx = pip_area.x + int(pip_area.w * xp)
-            cy = pip_area.y + int(pip_area.h * yp)
-            surface.blit(pip_img, pip_img.get_rect(center=(cx, cy)))
\ No newline at end of file
+            pip_img = _glyph(suit, font, text_color)
+
+        # All pips share one surface: centre by subtracting precomputed
+        # half-sizes rather than allocating a Rect per position.
+        pw, ph = pip_img.get_size()
+        half_w = pw >> 1
+        half_h = ph >> 1
+        px_, py_, pa_w, pa_h = pip_area.x, pip_area.y, pip_area.w, pip_area.h
+        for (xp, yp) in _PIP_LAYOUTS[count]:
+            blits.append((pip_img, (px_ + int(pa_w * xp) - half_w,
+                                    py_ + int(pa_h * yp) - half_h)))
+
+    surface.fblits(blits, premul)
\ No newline at end of file